@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 from .models import User
@@ -13,6 +14,15 @@ class CustomUserChangeForm(UserChangeForm):
         model = User
         fields = ('email', 'username', 'first_name', 'last_name', 'is_active', 'is_staff', 'is_superuser')
 
+class UserChangeList(ChangeList):
+    """Change list that only loads the columns the list page renders."""
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'id', 'email', 'username', 'first_name', 'last_name', 'role',
+            'is_staff', 'is_active', 'date_joined', 'region_id',
+        )
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     add_form = CustomUserCreationForm
@@ -20,9 +30,16 @@ class UserAdmin(BaseUserAdmin):
     model = User
     
     list_display = ('email', 'username', 'first_name', 'last_name', 'role', 'is_staff', 'is_active', 'date_joined')
-    list_filter = ('role', 'is_staff', 'is_superuser', 'is_active', 'date_joined', 'region')
+    list_filter = ('role', 'is_staff', 'is_superuser', 'is_active', 'region')
+    date_hierarchy = 'date_joined'
     search_fields = ('email', 'username', 'first_name', 'last_name')
     ordering = ('email',)
+    list_select_related = ('region',)
+    list_per_page = 50
+    show_full_result_count = False
+    autocomplete_fields = ('region',)
+    raw_id_fields = ('groups', 'user_permissions')
+    filter_horizontal = ()
     
     fieldsets = (
         (None, {'fields': ('email', 'username', 'password')}),
@@ -42,3 +59,6 @@ class UserAdmin(BaseUserAdmin):
     )
     
     readonly_fields = ('date_joined', 'last_login', 'created_at', 'updated_at')
+    
+    def get_changelist(self, request, **kwargs):
+        return UserChangeList
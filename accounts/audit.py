@@ -0,0 +1,90 @@
+"""
+Buffered audit logging.
+
+Entries are queued in-process and handed to a Celery task in batches, so a
+request only pays for a list append instead of an INSERT round trip. The
+batch is published from a background timer, never on the request thread.
+"""
+
+import atexit
+import logging
+import threading
+
+from django.db import connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 200
+FLUSH_INTERVAL = 0.5  # seconds
+
+_buffer = []
+_timer = None
+_lock = threading.Lock()
+
+
+def log_action(user, action, content_type='', object_id='', details=None,
+               ip_address=None, user_agent=''):
+    """Queue an audit log entry; it is written within FLUSH_INTERVAL."""
+    entry = {
+        'user_id': user.pk,
+        'action': action,
+        'content_type': content_type,
+        'object_id': str(object_id),
+        'details': details,
+        'ip_address': ip_address,
+        'user_agent': user_agent,
+        'timestamp': timezone.now().isoformat(),
+    }
+
+    with _lock:
+        _buffer.append(entry)
+        # A full batch goes straight away; otherwise the first entry of a
+        # batch arms the timer that drains it, so no entry waits for the
+        # next action to be written
+        if len(_buffer) >= FLUSH_BATCH_SIZE:
+            _schedule_flush(0)
+        elif _timer is None:
+            _schedule_flush(FLUSH_INTERVAL)
+
+
+def _schedule_flush(delay):
+    """Start a daemon timer that flushes the buffer (caller holds _lock)."""
+    global _timer
+
+    _timer = threading.Timer(delay, _flush_in_background)
+    _timer.daemon = True
+    _timer.start()
+
+
+def _flush_in_background():
+    try:
+        flush()
+    finally:
+        # The inline fallback may have opened this thread's own connection
+        connection.close()
+
+
+def flush():
+    """Send every queued entry to the flush task."""
+    global _buffer, _timer
+
+    with _lock:
+        batch, _buffer = _buffer, []
+        _timer = None
+
+    if not batch:
+        return
+
+    from .tasks import flush_audit_logs
+
+    try:
+        # Publish once: an unreachable broker should fail fast, not retry
+        flush_audit_logs.apply_async((batch,), retry=False)
+    except Exception as e:
+        # Broker unavailable: write inline rather than lose the entries
+        logger.warning(f'Audit log queue unavailable, writing inline: {e}')
+        flush_audit_logs(batch)
+
+
+atexit.register(flush)
@@ -2,43 +2,61 @@
 
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.contrib.auth.hashers import check_password, make_password
+from django.db.models.functions import Lower
+from django.utils.crypto import get_random_string
 
 User = get_user_model()
 
+# Hashed once at import so failed lookups can run the hasher for timing
+# parity without building a throwaway User and re-deriving a hash each time.
+_DUMMY_HASH = make_password(get_random_string(12))
+
 
 class EmailBackend(ModelBackend):
     """
     Authentication backend that allows users to log in using their email address.
     """
-    
+
     def authenticate(self, request, username=None, password=None, **kwargs):
         if username is None or password is None:
             return None
-            
-        try:
-            # Try to find user by email or username
-            user = User.objects.get(
-                Q(email__iexact=username) | Q(username__iexact=username)
-            )
-        except User.DoesNotExist:
-            # Run the default password hasher once to reduce timing
-            User().set_password(password)
+
+        users = User.objects.select_related('region')
+        # Email is the common login path; only fall back to username on a
+        # miss. Emails aren't unique, so a shared one is ambiguous and also
+        # falls back.
+        by_email = list(users.filter(email=username.lower())[:2])
+        if len(by_email) == 1:
+            user = by_email[0]
+        else:
+            # Compare through Lower() so the user_username_lower_idx
+            # expression index is used; iexact compiles to LIKE or UPPER()
+            user = users.alias(username_lower=Lower('username')).filter(
+                username_lower=username.lower()
+            ).first()
+        if user is None:
+            # Run the password hasher against a cached hash to reduce timing
+            check_password(password, _DUMMY_HASH)
             return None
-        except User.MultipleObjectsReturned:
-            # If multiple users have the same email, fall back to username
-            try:
-                user = User.objects.get(username__iexact=username)
-            except User.DoesNotExist:
-                return None
-        
-        if user.check_password(password) and self.user_can_authenticate(user):
+
+        # Evaluate both checks so the response time doesn't reveal which failed
+        password_ok = user.check_password(password)
+        can_authenticate = self.user_can_authenticate(user)
+        if password_ok & can_authenticate:
             return user
-        
+
         return None
-    
+
     def get_user(self, user_id):
         try:
-            return User.objects.get(pk=user_id)
+            # Keep password loaded: the session auth hash is derived from it.
+            # Keep updated_at too: save() on a deferred instance writes only
+            # loaded fields, so auto_now would never bump it (e.g. on a
+            # password change). farmer_profile (and its region) is joined
+            # too, since farmer pages all read it.
+            return User.objects.select_related('region', 'farmer_profile__region').defer(
+                'date_joined', 'created_at'
+            ).get(pk=user_id)
         except User.DoesNotExist:
             return None
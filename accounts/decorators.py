@@ -9,6 +9,36 @@ from django.contrib import messages
 from django.utils.translation import gettext as _
 
 
+def _has_allowed_role(request, allowed_roles):
+    """
+    Check the user's role against a frozenset of roles, memoizing the result
+    on the request so stacked decorators and mixins only evaluate it once.
+    """
+    cache = getattr(request, '_rbac_cache', None)
+    if cache is None:
+        cache = request._rbac_cache = {}
+    key = (request.user.pk, allowed_roles)
+    if key not in cache:
+        cache[key] = request.user.role in allowed_roles
+    return cache[key]
+
+
+def _region_denied(user, requested_region):
+    """
+    True if a non-admin user asks for a region other than their own.
+    
+    Every term is evaluated on plain values (the region is loaded with the
+    user by the auth backend), so the check costs the same on every path.
+    """
+    user_region_code = getattr(user.region, 'code', None)
+    return (
+        (user.role != 'admin')
+        & bool(requested_region)
+        & (user_region_code is not None)
+        & (user_region_code != requested_region)
+    )
+
+
 def role_required(allowed_roles):
     """
     Decorator that checks if user has one of the allowed roles.
@@ -18,11 +48,13 @@ def role_required(allowed_roles):
         def my_view(request):
             pass
     """
+    allowed = frozenset(allowed_roles)
+    
     def decorator(view_func):
         @wraps(view_func)
         @login_required
         def _wrapped_view(request, *args, **kwargs):
-            if request.user.role in allowed_roles:
+            if _has_allowed_role(request, allowed):
                 return view_func(request, *args, **kwargs)
             else:
                 messages.error(
@@ -63,18 +95,15 @@ def region_access_required(view_func):
         # Get region from URL parameters or POST data
         requested_region = kwargs.get('region_code') or request.GET.get('region') or request.POST.get('region')
         
-        if user.role == 'admin':
-            # Admin can access all regions
-            return view_func(request, *args, **kwargs)
-        elif requested_region and user.region and user.region.code != requested_region:
-            # User trying to access different region
+        if _region_denied(user, requested_region):
+            # Non-admin user trying to access a different region
             messages.error(
                 request,
                 _('You do not have permission to access data from this region.')
             )
             return redirect('core:dashboard')
-        else:
-            return view_func(request, *args, **kwargs)
+        
+        return view_func(request, *args, **kwargs)
     
     return _wrapped_view
 
@@ -88,12 +117,18 @@ class RoleRequiredMixin:
             allowed_roles = ['admin', 'buyer_head']
     """
     allowed_roles = []
+    _allowed_role_set = frozenset()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Freeze the roles once per view class; dispatch is a set lookup
+        cls._allowed_role_set = frozenset(cls.allowed_roles)
     
     def dispatch(self, request, *args, **kwargs):
         if not request.user.is_authenticated:
             return self.handle_no_permission()
         
-        if request.user.role not in self.allowed_roles:
+        if not _has_allowed_role(request, self._allowed_role_set):
             messages.error(
                 request,
                 _('You do not have permission to access this page.')
@@ -117,7 +152,7 @@ class RegionAccessMixin:
         user = request.user
         requested_region = kwargs.get('region_code') or request.GET.get('region')
         
-        if user.role != 'admin' and requested_region and user.region and user.region.code != requested_region:
+        if _region_denied(user, requested_region):
             messages.error(
                 request,
                 _('You do not have permission to access data from this region.')
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:32
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["email"], name="user_email_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.db.models.functions.text.Lower("username"),
+                name="user_username_lower_idx",
+            ),
+        ),
+    ]
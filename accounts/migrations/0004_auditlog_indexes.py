@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_user_lower_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["-timestamp"], name="accounts_au_timesta_40aa9a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["user", "-timestamp"], name="accounts_au_user_id_1110c4_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["action", "-timestamp"], name="accounts_au_action_918219_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["content_type", "object_id"],
+                name="accounts_au_content_4b4dd4_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:35
+
+from django.db import migrations, models
+
+
+def empty_details_to_null(apps, schema_editor):
+    AuditLog = apps.get_model("accounts", "AuditLog")
+    AuditLog.objects.filter(details={}).update(details=None)
+
+
+def null_details_to_empty(apps, schema_editor):
+    AuditLog = apps.get_model("accounts", "AuditLog")
+    AuditLog.objects.filter(details__isnull=True).update(details={})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_auditlog_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="auditlog",
+            name="details",
+            field=models.JSONField(
+                blank=True, default=None, null=True, verbose_name="Details"
+            ),
+        ),
+        migrations.RunPython(empty_details_to_null, null_details_to_empty),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:39
+
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    User.objects.update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_auditlog_timestamp_default"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,25 @@
 """User accounts and RBAC models for Kannammal Agro."""
 
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.db import models
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from core.models import BaseModel
 
 
+# The role breakdown changes slowly, so it is recounted on a schedule
+# (every ROLE_DISTRIBUTION_REFRESH seconds) rather than on every admin page
+# load. The cache outlives one refresh so readers don't fall back to a
+# count while the periodic task is running.
+ROLE_DISTRIBUTION_CACHE_KEY = 'role_distribution_v1'
+ROLE_DISTRIBUTION_REFRESH = 15 * 60
+ROLE_DISTRIBUTION_TIMEOUT = 2 * ROLE_DISTRIBUTION_REFRESH
+
+
 class User(AbstractUser):
     """Custom user model with role-based access control."""
     
@@ -55,29 +68,44 @@ class User(AbstractUser):
     class Meta:
         verbose_name = _('User')
         verbose_name_plural = _('Users')
+        indexes = [
+            models.Index(fields=['email'], name='user_email_idx'),
+            models.Index(Lower('username'), name='user_username_lower_idx'),
+        ]
         
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
     
+    def save(self, *args, **kwargs):
+        # Emails are stored lowercase so logins can use an exact index probe
+        if self.email:
+            self.email = self.email.lower()
+        super().save(*args, **kwargs)
+    
+    @property
+    def role_flags(self):
+        """Map of role -> bool for this user's current role."""
+        return _ROLE_FLAGS.get(self.role, _NO_ROLE_FLAGS)
+    
     @property
     def is_admin(self):
-        return self.role == 'admin'
+        return self.role_flags['admin']
     
     @property
     def is_region_head(self):
-        return self.role == 'region_head'
+        return self.role_flags['region_head']
     
     @property
     def is_buyer_head(self):
-        return self.role == 'buyer_head'
+        return self.role_flags['buyer_head']
     
     @property
     def is_buyer(self):
-        return self.role == 'buyer'
+        return self.role_flags['buyer']
     
     @property
     def is_farmer(self):
-        return self.role == 'farmer'
+        return self.role_flags['farmer']
     
     def can_access_region(self, region):
         """Check if user can access data for a specific region."""
@@ -85,14 +113,36 @@ class User(AbstractUser):
             return True
         return self.region == region
     
-    def get_accessible_regions(self):
-        """Get regions this user can access."""
+    @classmethod
+    def count_by_role(cls):
+        """Number of users in each role, as a list of {'role', 'count'} dicts."""
+        return list(cls.objects.values('role').annotate(count=models.Count('role')))
+    
+    @classmethod
+    def role_distribution(cls):
+        """count_by_role(), cached and kept fresh by refresh_role_distribution."""
+        return cache.get_or_set(
+            ROLE_DISTRIBUTION_CACHE_KEY, cls.count_by_role, ROLE_DISTRIBUTION_TIMEOUT
+        )
+    
+    @cached_property
+    def accessible_regions(self):
+        """Regions this user can access, evaluated once per user instance."""
         from regions.models import Region
         if self.is_admin:
-            return Region.objects.all()
-        elif self.region:
-            return Region.objects.filter(id=self.region.id)
-        return Region.objects.none()
+            return list(Region.objects.all())
+        elif self.region_id:
+            return list(Region.objects.filter(id=self.region_id))
+        return []
+
+
+# Role flag lookups precomputed once per role, so the is_<role> properties
+# are a dict lookup rather than a string comparison on every access.
+_ROLES = tuple(code for code, _label in User.ROLE_CHOICES)
+_ROLE_FLAGS = {
+    role: {other: other == role for other in _ROLES} for role in _ROLES
+}
+_NO_ROLE_FLAGS = dict.fromkeys(_ROLES, False)
 
 
 class UserProfile(BaseModel):
@@ -169,8 +219,9 @@ class AuditLog(models.Model):
         verbose_name=_('Object ID')
     )
     details = models.JSONField(
-        default=dict,
+        null=True,
         blank=True,
+        default=None,
         verbose_name=_('Details')
     )
     ip_address = models.GenericIPAddressField(
@@ -182,12 +233,19 @@ class AuditLog(models.Model):
         blank=True,
         verbose_name=_('User Agent')
     )
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the action is queued, not when the batch is written
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     
     class Meta:
         verbose_name = _('Audit Log')
         verbose_name_plural = _('Audit Logs')
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['-timestamp']),
+            models.Index(fields=['user', '-timestamp']),
+            models.Index(fields=['action', '-timestamp']),
+            models.Index(fields=['content_type', 'object_id']),
+        ]
         
     def __str__(self):
         return f"{self.user.username} - {self.get_action_display()} at {self.timestamp}"
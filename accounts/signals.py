@@ -0,0 +1,29 @@
+"""Signal handlers for the accounts app."""
+
+from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.dispatch import receiver
+
+from .audit import log_action
+
+
+def _client_details(request):
+    """Client IP address and user agent to record with an audit entry."""
+    if request is None:
+        return {}
+    return {
+        'ip_address': request.META.get('REMOTE_ADDR'),
+        'user_agent': request.META.get('HTTP_USER_AGENT', ''),
+    }
+
+
+@receiver(user_logged_in)
+def audit_login(sender, request, user, **kwargs):
+    """Record a successful login in the audit log."""
+    log_action(user, 'login', **_client_details(request))
+
+
+@receiver(user_logged_out)
+def audit_logout(sender, request, user, **kwargs):
+    """Record a logout in the audit log (anonymous sessions have no user)."""
+    if user is not None:
+        log_action(user, 'logout', **_client_details(request))
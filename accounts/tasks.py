@@ -0,0 +1,26 @@
+"""Background tasks for accounts app."""
+
+from celery import shared_task
+from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
+
+from .models import (
+    ROLE_DISTRIBUTION_CACHE_KEY, ROLE_DISTRIBUTION_TIMEOUT, AuditLog, User
+)
+
+
+@shared_task
+def flush_audit_logs(batch):
+    """Insert a batch of queued audit log entries in one query."""
+    entries = []
+    for data in batch:
+        data = dict(data)
+        data['timestamp'] = parse_datetime(data['timestamp'])
+        entries.append(AuditLog(**data))
+    AuditLog.objects.bulk_create(entries)
+
+
+@shared_task
+def refresh_role_distribution():
+    """Recount users per role into the cache read by User.role_distribution()."""
+    cache.set(ROLE_DISTRIBUTION_CACHE_KEY, User.count_by_role(), ROLE_DISTRIBUTION_TIMEOUT)
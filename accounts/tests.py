@@ -1,3 +1,135 @@
+from unittest import mock
+
 from django.test import TestCase
 
-# Create your tests here.
+from farmers.models import Farmer
+from regions.models import Region
+
+from . import audit
+from .backends import EmailBackend
+from .models import AuditLog, User
+
+
+class AuditLogBufferTests(TestCase):
+    """Audit entries are batched off the request thread and never dropped."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('auditor', 'auditor@example.com', 'pw')
+        self.addCleanup(self._reset_buffer)
+        self._reset_buffer()
+
+    def _reset_buffer(self):
+        with audit._lock:
+            if audit._timer is not None:
+                audit._timer.cancel()
+            audit._timer = None
+            audit._buffer.clear()
+
+    @mock.patch('accounts.tasks.flush_audit_logs.apply_async')
+    def test_log_action_does_not_publish_on_the_calling_thread(self, apply_async):
+        with mock.patch.object(audit, '_schedule_flush') as schedule:
+            audit.log_action(self.user, 'read')
+        schedule.assert_called_once_with(audit.FLUSH_INTERVAL)
+        apply_async.assert_not_called()
+        self.assertEqual(len(audit._buffer), 1)
+
+    @mock.patch('accounts.tasks.flush_audit_logs.apply_async')
+    def test_timer_drains_a_lone_entry(self, apply_async):
+        audit.log_action(self.user, 'read', object_id=7)
+        timer = audit._timer
+        timer.join(audit.FLUSH_INTERVAL + 2)
+
+        apply_async.assert_called_once()
+        (batch,), = apply_async.call_args.args
+        self.assertEqual([entry['object_id'] for entry in batch], ['7'])
+        self.assertEqual(apply_async.call_args.kwargs, {'retry': False})
+        self.assertEqual(audit._buffer, [])
+
+    @mock.patch('accounts.tasks.flush_audit_logs.apply_async')
+    def test_full_batch_is_flushed_immediately(self, apply_async):
+        with mock.patch.object(audit, '_schedule_flush') as schedule:
+            for _ in range(audit.FLUSH_BATCH_SIZE):
+                audit.log_action(self.user, 'read')
+        schedule.assert_called_with(0)
+
+    @mock.patch('accounts.tasks.flush_audit_logs.apply_async', side_effect=OSError('down'))
+    def test_broker_outage_writes_entries_inline(self, apply_async):
+        with mock.patch.object(audit, '_schedule_flush'):
+            audit.log_action(self.user, 'update', content_type='farmer', object_id=3)
+        with mock.patch.object(audit, 'logger') as logger:
+            audit.flush()
+        logger.warning.assert_called_once()
+
+        log = AuditLog.objects.get()
+        self.assertEqual((log.user, log.action, log.object_id), (self.user, 'update', '3'))
+
+    def test_login_and_logout_are_audited(self):
+        with mock.patch.object(audit, '_schedule_flush'):
+            self.client.login(username='auditor@example.com', password='pw')
+            self.client.logout()
+        self.assertEqual([entry['action'] for entry in audit._buffer], ['login', 'logout'])
+        self.assertEqual(audit._buffer[0]['user_id'], self.user.pk)
+
+
+class EmailBackendQueryTests(TestCase):
+    """Logging in and loading the session user each cost one query."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Region.objects.create(name='Salem', code='SLM')
+        cls.user = User.objects.create_user(
+            'grower', 'Grower@Example.com', 'pw', role='farmer', region=cls.region
+        )
+        Farmer.objects.create(
+            user=cls.user, region=cls.region, contact_number='9000000000', address='Salem'
+        )
+
+    def setUp(self):
+        self.backend = EmailBackend()
+
+    def test_authenticate_by_email_is_one_query(self):
+        with self.assertNumQueries(1):
+            user = self.backend.authenticate(None, username='GROWER@example.com', password='pw')
+        self.assertEqual(user, self.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(user.region.name, 'Salem')
+
+    def test_authenticate_by_username_falls_back_with_one_more_query(self):
+        with self.assertNumQueries(2):
+            user = self.backend.authenticate(None, username='GROWER', password='pw')
+        self.assertEqual(user, self.user)
+
+    def test_authenticate_rejects_bad_password_and_unknown_user(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(
+                self.backend.authenticate(None, username='grower@example.com', password='nope')
+            )
+        with self.assertNumQueries(2):
+            self.assertIsNone(self.backend.authenticate(None, username='nobody', password='pw'))
+
+    def test_shared_email_falls_back_to_username(self):
+        User.objects.create_user('grower2', 'grower@example.com', 'pw')
+        with self.assertNumQueries(2):
+            self.assertIsNone(
+                self.backend.authenticate(None, username='grower@example.com', password='pw')
+            )
+        user = self.backend.authenticate(None, username='Grower2', password='pw')
+        self.assertEqual(user.username, 'grower2')
+
+    def test_get_user_joins_region_and_farmer_profile(self):
+        with self.assertNumQueries(1):
+            user = self.backend.get_user(self.user.pk)
+            self.assertEqual(user.region.name, 'Salem')
+            self.assertEqual(user.farmer_profile.region.name, 'Salem')
+            self.assertEqual(user.get_session_auth_hash(), self.user.get_session_auth_hash())
+
+    def test_session_user_save_bumps_updated_at(self):
+        user = self.backend.get_user(self.user.pk)
+        user.set_password('new-pw')
+        user.save()
+        user.refresh_from_db(fields=['updated_at'])
+        self.assertGreater(user.updated_at, self.user.updated_at)
+
+    def test_get_user_unknown_id(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.backend.get_user(0))
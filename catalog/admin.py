@@ -6,14 +6,17 @@ class SKUImageInline(admin.TabularInline):
     model = SKUImage
     extra = 1
     fields = ('image', 'caption', 'is_primary')
+    raw_id_fields = ('sku',)
 
 
 @admin.register(SKU)
 class SKUAdmin(admin.ModelAdmin):
     list_display = ('name', 'code', 'category', 'unit', 'is_active', 'created_at')
-    list_filter = ('category', 'unit', 'is_active', 'created_at')
+    list_filter = ('category', 'unit', 'is_active')
+    date_hierarchy = 'created_at'
     search_fields = ('name', 'code', 'description')
     ordering = ('category', 'name')
+    show_full_result_count = False
     inlines = [SKUImageInline]
     
     fieldsets = (
@@ -44,6 +47,8 @@ class SKUImageAdmin(admin.ModelAdmin):
     list_filter = ('is_primary', 'created_at')
     search_fields = ('sku__name', 'caption')
     ordering = ('sku', '-is_primary', 'created_at')
+    list_select_related = ('sku',)
+    raw_id_fields = ('sku',)
     
     fieldsets = (
         ('Image Information', {
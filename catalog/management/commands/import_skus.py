@@ -6,277 +6,307 @@ from catalog.models import SKU
 import re
 
 
-class Command(BaseCommand):
-    help = 'Import SKUs from predefined list'
+SKU_LIST = (
+    "Coconut",
+    "Onion Big",
+    "Tomato Country",
+    "Carrot",
+    "Pomegranate",
+    "Potato",
+    "Onion Sambar",
+    "Tomato Hybrid",
+    "Banana Nendran",
+    "Beetroot",
+    "Guava Thailand",
+    "Apple Envy",
+    "Cucumber Salad",
+    "Apple Himachal Indian",
+    "Ginger Fresh",
+    "Apple Royal Gala",
+    "Lemon",
+    "Mango Neelam",
+    "Orange Imported",
+    "Beans French",
+    "Ladies Finger",
+    "Cauliflower",
+    "Water Melon Kiran",
+    "Chilli Green",
+    "Garlic Himachal",
+    "Banana Green Nendran",
+    "Apple Red Delicious",
+    "Cucumber Malabar",
+    "Garlic Small",
+    "American Sweet Corn Pack Of 2",
+    "Dragon Fruit Red Indian Kg",
+    "Pine Apple",
+    "Apple Pink Lady",
+    "Strawberry",
+    "Garlic Big",
+    "Mini Orange",
+    "Gooseberry amla",
+    "Cabbage",
+    "Drum Stick",
+    "Corriander Leaves",
+    "Capsicum Green",
+    "Brinjal Vari",
+    "Kiwi Pack Of 3",
+    "Coccinia",
+    "Apple Granny Smith",
+    "Papaya",
+    "Chilli Thondan",
+    "Banana Raw",
+    "Chilli Bullet",
+    "Apple Fuji",
+    "Mango Raw",
+    "Avacado Imported",
+    "Sweet Potato",
+    "Button Mushroom",
+    "Dragon Fruit White",
+    "American Sweet Corn Pc",
+    "Snake Gourd",
+    "Cucumber English",
+    "Pear Red",
+    "Banana Yellaki Rasakathali",
+    "Blue Berry Imported",
+    "Plums Indain",
+    "Avacado",
+    "Apple New Zealand Royal Gala",
+    "Grapes Imported",
+    "Beans Cowpea Long",
+    "Bitter Gourd White",
+    "Mango Raw Totapuri",
+    "Pumpkin",
+    "Pears Indian",
+    "Beans Haricot",
+    "Apple Shimla Indian",
+    "Pomegranate Medium Kg",
+    "Apple Washington Red",
+    "Spinach Palak Bunch",
+    "Bottle Gourd",
+    "Yam",
+    "Musk Melon",
+    "Beans Cluster",
+    "Rambutan",
+    "Plums Imported",
+    "Mint Leaves",
+    "Colacasia Big",
+    "Grapes Red Globe Indian",
+    "Guava White",
+    "Sweet Orange",
+    "Bitter Gourd Green",
+    "Tapioca",
+    "Banana Red Kappa",
+    "Grapes Dilkush",
+    "Cucumber Madras",
+    "Beans Avarai Small",
+    "Broccoli",
+    "Grapes Panner",
+    "Banana Robusta Green",
+    "Oyster Mushroom",
+    "Koorka",
+    "Grapes Banglore Blue",
+    "Chilli bhajji",
+    "Banana Karpooravalli",
+    "Banana Robusta Yellow",
+    "Brinjal Long Green",
+    "Banana Poovan",
+    "Brinjal Nadan",
+    "Curry Leaves",
+    "Banana Palayamthodan",
+    "Amaranthus Green Bunch",
+    "Ash Gourd",
+    "Apple Goru",
+    "Ground Nut",
+    "Chow Chow",
+    "Ridge Gourd",
+    "Radish White",
+    "Pear Green",
+    "White Egg 6PC",
+    "Beans Cowpea Small",
+    "Water apple",
+    "Colacasia Small",
+    "Custard Apple",
+    "Lettuce Ice Berg",
+    "Amaranthus Red Bunch",
+    "Chinese Cabbage",
+    "Apple I Red",
+    "Golden Kiwi 3Pc",
+    "Apple Granny 4 Pcs",
+    "Sapota  Cricket Ball",
+    "Cabbage Red",
+    "Sapota Hybrid",
+    "Country Egg 6PC",
+    "Mangosteen",
+    "Capsicum Color",
+    "Banana Flower",
+    "Orange Nagpur",
+    "Apple Granny 2 Pcs",
+    "Apple Royal Gala 2 Pcs",
+    "Snake Gourd Long",
+    "Pumpkin Red",
+    "Orange Mandarin 500gm",
+    "Agathi Keera Bunch",
+    "Grapes green imported",
+    "Mango Totapuri",
+    "Milky Mushroom",
+    "Brinjal White",
+    "Sambar Kit",
+    "Baby Potato",
+    "Apple Royal Gala 4 Pcs",
+    "Jujube Fruit",
+    "Veg Biryani Pack 250g",
+    "Apple Pink lady 4 Pcs",
+    "Spring Onion",
+    "Plums imported 4 Pcs",
+    "Zucchini Green",
+    "Ponnanganni Keerai Bunch",
+    "Baby Corn Unpleed",
+    "Banana Leaves pc",
+    "Sweet tamarind",
+    "Zucchini Yellow",
+    "Fresh Mango Juice 250ml",
+    "Dragon Fruit Red",
+    "Cut Fruit Mix",
+    "Grapes Sonaka Seedless",
+    "Tn Beetroot",
+    "Dragon Fruit Yelllow Kg",
+    "Mango Sindhura",
+    "Spring Onion Pc",
+    "Celery",
+    "Grapes Balck Seedless",
+    "Leek",
+    "Fresh fig",
+    "Litchi",
+    "Sour passion fruit Kg",
+    "Lemon Big",
+    "Mango Imam",
+    "KARUNAI KILANGU",
+    "Knolkhol Kg",
+    "Bitter Gourd Nadan",
+    "Coriander Kg",
+    "Mango Dasheri",
+    "Marigold Flower",
+    "Pineapple Small",
+    "Water Melon",
+    "Fresh pigeon pea Kg",
+    "Apple Kashmir Red Delicious",
+    "Basil Leaves",
+    "Fried Rice Mix 300g",
+    "Baby Corn Peeled",
+    "Lettuce Head Bunch-Kg",
+    "Rosemary",
+    "American Sweetcorn Peeled-Unit",
+    "Micro Radish",
+    "Sun Melon",
+    "Tn Cabbage",
+    "Tender Jack Fruit",
+)
+
+FRUIT_KEYWORDS = (
+    'apple', 'banana', 'mango', 'orange', 'grapes', 'strawberry',
+    'pineapple', 'papaya', 'guava', 'lemon', 'kiwi', 'dragon fruit',
+    'pomegranate', 'avacado', 'pear', 'plums', 'litchi', 'rambutan',
+    'mangosteen', 'custard apple', 'sapota', 'gooseberry', 'amla',
+    'blue berry', 'fresh fig', 'water melon', 'musk melon', 'sun melon',
+    'sweet tamarind', 'jujube fruit', 'water apple', 'passion fruit'
+)
+
+VEGETABLE_KEYWORDS = (
+    'onion', 'tomato', 'carrot', 'potato', 'beetroot', 'cucumber',
+    'ginger', 'beans', 'ladies finger', 'cauliflower', 'chilli',
+    'garlic', 'capsicum', 'brinjal', 'cabbage', 'drum stick',
+    'coccinia', 'gourd', 'spinach', 'yam', 'broccoli', 'mushroom',
+    'radish', 'lettuce', 'amaranthus', 'chow chow', 'ridge gourd',
+    'ash gourd', 'colacasia', 'tapioca', 'koorka', 'celery', 'leek',
+    'zucchini', 'corn', 'pumpkin'
+)
+
+# Keywords are matched as plain substrings. Both lists share one pattern
+# whose lookahead reports a keyword at every position, fruits first, so a
+# single scan finds every category present in a name (any fruit wins).
+_KEYWORD_RE = re.compile(
+    '(?=(%s))' % '|'.join(map(re.escape, FRUIT_KEYWORDS + VEGETABLE_KEYWORDS))
+)
+_KEYWORD_CATEGORY = {
+    **dict.fromkeys(VEGETABLE_KEYWORDS, 'vegetable'),
+    **dict.fromkeys(FRUIT_KEYWORDS, 'fruit'),
+}
+_LEAFY_RE = re.compile('leaves|flower|bunch')
+_OTHER_RE = re.compile('egg|kit|mix|juice')
+_PIECE_RE = re.compile('pack|pc|piece')
+_BUNDLE_RE = re.compile('bunch|leaves')
+_GRAM_RE = re.compile('ml|gm|gram')
+
+
+# Characters generate_sku_code strips from a name before building the code
+_NON_CODE_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+
+def generate_sku_code(name):
+    """Generate a base SKU code from product name."""
+    # Remove special characters and convert to uppercase
+    code = _NON_CODE_CHARS_RE.sub('', name)
+    # Take first 3 characters of each word, max 10 chars total
+    words = code.split()
+    if len(words) == 1:
+        return words[0][:10].upper()
+    elif len(words) == 2:
+        return (words[0][:4] + words[1][:4]).upper()
+    else:
+        return ''.join([word[:3] for word in words[:3]]).upper()
+
+
+def categorize_product(name):
+    """Categorize product based on name keywords."""
+    name_lower = name.lower()
+    
+    categories = {
+        _KEYWORD_CATEGORY[match.group(1)]
+        for match in _KEYWORD_RE.finditer(name_lower)
+    }
+    if 'fruit' in categories:
+        return 'fruit'
     
-    SKU_LIST = [
-        "Coconut",
-        "Onion Big",
-        "Tomato Country",
-        "Carrot",
-        "Pomegranate",
-        "Potato",
-        "Onion Sambar",
-        "Tomato Hybrid",
-        "Banana Nendran",
-        "Beetroot",
-        "Guava Thailand",
-        "Apple Envy",
-        "Cucumber Salad",
-        "Apple Himachal Indian",
-        "Ginger Fresh",
-        "Apple Royal Gala",
-        "Lemon",
-        "Mango Neelam",
-        "Orange Imported",
-        "Beans French",
-        "Ladies Finger",
-        "Cauliflower",
-        "Water Melon Kiran",
-        "Chilli Green",
-        "Garlic Himachal",
-        "Banana Green Nendran",
-        "Apple Red Delicious",
-        "Cucumber Malabar",
-        "Garlic Small",
-        "American Sweet Corn Pack Of 2",
-        "Dragon Fruit Red Indian Kg",
-        "Pine Apple",
-        "Apple Pink Lady",
-        "Strawberry",
-        "Garlic Big",
-        "Mini Orange",
-        "Gooseberry amla",
-        "Cabbage",
-        "Drum Stick",
-        "Corriander Leaves",
-        "Capsicum Green",
-        "Brinjal Vari",
-        "Kiwi Pack Of 3",
-        "Coccinia",
-        "Apple Granny Smith",
-        "Papaya",
-        "Chilli Thondan",
-        "Banana Raw",
-        "Chilli Bullet",
-        "Apple Fuji",
-        "Mango Raw",
-        "Avacado Imported",
-        "Sweet Potato",
-        "Button Mushroom",
-        "Dragon Fruit White",
-        "American Sweet Corn Pc",
-        "Snake Gourd",
-        "Cucumber English",
-        "Pear Red",
-        "Banana Yellaki Rasakathali",
-        "Blue Berry Imported",
-        "Plums Indain",
-        "Avacado",
-        "Apple New Zealand Royal Gala",
-        "Grapes Imported",
-        "Beans Cowpea Long",
-        "Bitter Gourd White",
-        "Mango Raw Totapuri",
-        "Pumpkin",
-        "Pears Indian",
-        "Beans Haricot",
-        "Apple Shimla Indian",
-        "Pomegranate Medium Kg",
-        "Apple Washington Red",
-        "Spinach Palak Bunch",
-        "Bottle Gourd",
-        "Yam",
-        "Musk Melon",
-        "Beans Cluster",
-        "Rambutan",
-        "Plums Imported",
-        "Mint Leaves",
-        "Colacasia Big",
-        "Grapes Red Globe Indian",
-        "Guava White",
-        "Sweet Orange",
-        "Bitter Gourd Green",
-        "Tapioca",
-        "Banana Red Kappa",
-        "Grapes Dilkush",
-        "Cucumber Madras",
-        "Beans Avarai Small",
-        "Broccoli",
-        "Grapes Panner",
-        "Banana Robusta Green",
-        "Oyster Mushroom",
-        "Koorka",
-        "Grapes Banglore Blue",
-        "Chilli bhajji",
-        "Banana Karpooravalli",
-        "Banana Robusta Yellow",
-        "Brinjal Long Green",
-        "Banana Poovan",
-        "Brinjal Nadan",
-        "Curry Leaves",
-        "Banana Palayamthodan",
-        "Amaranthus Green Bunch",
-        "Ash Gourd",
-        "Apple Goru",
-        "Ground Nut",
-        "Chow Chow",
-        "Ridge Gourd",
-        "Radish White",
-        "Pear Green",
-        "White Egg 6PC",
-        "Beans Cowpea Small",
-        "Water apple",
-        "Colacasia Small",
-        "Custard Apple",
-        "Lettuce Ice Berg",
-        "Amaranthus Red Bunch",
-        "Chinese Cabbage",
-        "Apple I Red",
-        "Golden Kiwi 3Pc",
-        "Apple Granny 4 Pcs",
-        "Sapota  Cricket Ball",
-        "Cabbage Red",
-        "Sapota Hybrid",
-        "Country Egg 6PC",
-        "Mangosteen",
-        "Capsicum Color",
-        "Banana Flower",
-        "Orange Nagpur",
-        "Apple Granny 2 Pcs",
-        "Apple Royal Gala 2 Pcs",
-        "Snake Gourd Long",
-        "Pumpkin Red",
-        "Orange Mandarin 500gm",
-        "Agathi Keera Bunch",
-        "Grapes green imported",
-        "Mango Totapuri",
-        "Milky Mushroom",
-        "Brinjal White",
-        "Sambar Kit",
-        "Baby Potato",
-        "Apple Royal Gala 4 Pcs",
-        "Jujube Fruit",
-        "Veg Biryani Pack 250g",
-        "Apple Pink lady 4 Pcs",
-        "Spring Onion",
-        "Plums imported 4 Pcs",
-        "Zucchini Green",
-        "Ponnanganni Keerai Bunch",
-        "Baby Corn Unpleed",
-        "Banana Leaves pc",
-        "Sweet tamarind",
-        "Zucchini Yellow",
-        "Fresh Mango Juice 250ml",
-        "Dragon Fruit Red",
-        "Cut Fruit Mix",
-        "Grapes Sonaka Seedless",
-        "Tn Beetroot",
-        "Dragon Fruit Yelllow Kg",
-        "Mango Sindhura",
-        "Spring Onion Pc",
-        "Celery",
-        "Grapes Balck Seedless",
-        "Leek",
-        "Fresh fig",
-        "Litchi",
-        "Sour passion fruit Kg",
-        "Lemon Big",
-        "Mango Imam",
-        "KARUNAI KILANGU",
-        "Knolkhol Kg",
-        "Bitter Gourd Nadan",
-        "Coriander Kg",
-        "Mango Dasheri",
-        "Marigold Flower",
-        "Pineapple Small",
-        "Water Melon",
-        "Fresh pigeon pea Kg",
-        "Apple Kashmir Red Delicious",
-        "Basil Leaves",
-        "Fried Rice Mix 300g",
-        "Baby Corn Peeled",
-        "Lettuce Head Bunch-Kg",
-        "Rosemary",
-        "American Sweetcorn Peeled-Unit",
-        "Micro Radish",
-        "Sun Melon",
-        "Tn Cabbage",
-        "Tender Jack Fruit"
-    ]
+    if categories:
+        return 'vegetable'
+    
+    # Special cases
+    if _LEAFY_RE.search(name_lower):
+        return 'vegetable'
+    elif _OTHER_RE.search(name_lower):
+        return 'other'
+    elif 'coconut' in name_lower:
+        return 'fruit'
+    
+    return 'vegetable'  # Default
 
-    def generate_sku_code(self, name):
-        """Generate a unique SKU code from product name."""
-        # Remove special characters and convert to uppercase
-        code = re.sub(r'[^a-zA-Z0-9\s]', '', name)
-        # Take first 3 characters of each word, max 10 chars total
-        words = code.split()
-        if len(words) == 1:
-            return words[0][:10].upper()
-        elif len(words) == 2:
-            return (words[0][:4] + words[1][:4]).upper()
-        else:
-            return ''.join([word[:3] for word in words[:3]]).upper()
 
-    def categorize_product(self, name):
-        """Categorize product based on name keywords."""
-        name_lower = name.lower()
-        
-        # Fruits
-        fruit_keywords = [
-            'apple', 'banana', 'mango', 'orange', 'grapes', 'strawberry', 
-            'pineapple', 'papaya', 'guava', 'lemon', 'kiwi', 'dragon fruit',
-            'pomegranate', 'avacado', 'pear', 'plums', 'litchi', 'rambutan',
-            'mangosteen', 'custard apple', 'sapota', 'gooseberry', 'amla',
-            'blue berry', 'fresh fig', 'water melon', 'musk melon', 'sun melon',
-            'sweet tamarind', 'jujube fruit', 'water apple', 'passion fruit'
-        ]
-        
-        # Vegetables  
-        vegetable_keywords = [
-            'onion', 'tomato', 'carrot', 'potato', 'beetroot', 'cucumber',
-            'ginger', 'beans', 'ladies finger', 'cauliflower', 'chilli',
-            'garlic', 'capsicum', 'brinjal', 'cabbage', 'drum stick',
-            'coccinia', 'gourd', 'spinach', 'yam', 'broccoli', 'mushroom',
-            'radish', 'lettuce', 'amaranthus', 'chow chow', 'ridge gourd',
-            'ash gourd', 'colacasia', 'tapioca', 'koorka', 'celery', 'leek',
-            'zucchini', 'corn', 'pumpkin'
-        ]
-        
-        # Check for fruits
-        for keyword in fruit_keywords:
-            if keyword in name_lower:
-                return 'fruit'
-        
-        # Check for vegetables
-        for keyword in vegetable_keywords:
-            if keyword in name_lower:
-                return 'vegetable'
-        
-        # Special cases
-        if any(word in name_lower for word in ['leaves', 'flower', 'bunch']):
-            return 'vegetable'
-        elif any(word in name_lower for word in ['egg', 'kit', 'mix', 'juice']):
-            return 'other'
-        elif 'coconut' in name_lower:
-            return 'fruit'
-        
-        return 'vegetable'  # Default
+def determine_unit(name):
+    """Determine unit based on product name."""
+    name_lower = name.lower()
+    
+    if _PIECE_RE.search(name_lower):
+        return 'piece'
+    elif _BUNDLE_RE.search(name_lower):
+        return 'bundle'
+    elif 'kg' in name_lower:
+        return 'kg'
+    elif _GRAM_RE.search(name_lower):
+        return 'gram'
+    else:
+        return 'kg'  # Default
 
-    def determine_unit(self, name):
-        """Determine unit based on product name."""
-        name_lower = name.lower()
-        
-        if any(word in name_lower for word in ['pack', 'pc', 'pcs', 'piece']):
-            return 'piece'
-        elif any(word in name_lower for word in ['bunch', 'leaves']):
-            return 'bundle'
-        elif 'kg' in name_lower:
-            return 'kg'
-        elif any(word in name_lower for word in ['ml', 'gm', 'gram']):
-            return 'gram'
-        else:
-            return 'kg'  # Default
+
+# (name, base code, category, unit) for every product, computed once at
+# import so the command itself only does database work.
+PRECOMPUTED_SKUS = tuple(
+    (name, generate_sku_code(name), categorize_product(name), determine_unit(name))
+    for name in SKU_LIST
+)
+
+
+class Command(BaseCommand):
+    help = 'Import SKUs from predefined list'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -297,50 +327,42 @@ class Command(BaseCommand):
         created_count = 0
         updated_count = 0
         error_count = 0
+        new_skus = []
+        
+        # Load every existing name/code once and resolve everything in memory
+        existing_by_name = dict(SKU.objects.values_list('name', 'code'))
+        existing_codes = set(existing_by_name.values())
         
-        for product_name in self.SKU_LIST:
+        for product_name, base_code, category, unit in PRECOMPUTED_SKUS:
             try:
-                # Generate SKU code
-                sku_code = self.generate_sku_code(product_name)
+                if product_name in existing_by_name:
+                    updated_count += 1
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f'Already exists: {existing_by_name[product_name]} - {product_name}'
+                        )
+                    )
+                    continue
                 
                 # Ensure uniqueness
-                base_code = sku_code
+                sku_code = base_code
                 counter = 1
-                while SKU.objects.filter(code=sku_code).exists():
+                while sku_code in existing_codes:
                     sku_code = f"{base_code}{counter:02d}"
                     counter += 1
                 
-                # Determine category and unit
-                category = self.categorize_product(product_name)
-                unit = self.determine_unit(product_name)
+                existing_codes.add(sku_code)
+                existing_by_name[product_name] = sku_code
                 
                 if not dry_run:
-                    sku, created = SKU.objects.get_or_create(
+                    new_skus.append(SKU(
                         name=product_name,
-                        defaults={
-                            'code': sku_code,
-                            'category': category,
-                            'unit': unit,
-                            'is_active': True,
-                            'min_order_quantity': 1.0
-                        }
-                    )
-                    
-                    if created:
-                        created_count += 1
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f'Created: {sku.code} - {sku.name} '
-                                f'({sku.category}, {sku.unit})'
-                            )
-                        )
-                    else:
-                        updated_count += 1
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f'Already exists: {sku.code} - {sku.name}'
-                            )
-                        )
+                        code=sku_code,
+                        category=category,
+                        unit=unit,
+                        is_active=True,
+                        min_order_quantity=1.0
+                    ))
                 else:
                     self.stdout.write(
                         f'Would create: {sku_code} - {product_name} '
@@ -356,6 +378,31 @@ class Command(BaseCommand):
                     )
                 )
         
+        if new_skus:
+            SKU.objects.bulk_create(new_skus, ignore_conflicts=True, batch_size=500)
+            # A code taken by another import in the meantime is silently
+            # skipped, so report only the rows that are now stored
+            stored = set(
+                SKU.objects.filter(code__in=[sku.code for sku in new_skus])
+                .values_list('code', 'name')
+            )
+            for sku in new_skus:
+                if (sku.code, sku.name) in stored:
+                    created_count += 1
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f'Created: {sku.code} - {sku.name} '
+                            f'({sku.category}, {sku.unit})'
+                        )
+                    )
+                else:
+                    error_count += 1
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f'Error processing {sku.name}: code {sku.code} is already taken'
+                        )
+                    )
+        
         # Summary
         self.stdout.write(
             self.style.SUCCESS(
@@ -363,7 +410,7 @@ class Command(BaseCommand):
                 f'Created: {created_count}\n'
                 f'Already existed: {updated_count}\n'
                 f'Errors: {error_count}\n'
-                f'Total processed: {len(self.SKU_LIST)}'
+                f'Total processed: {len(SKU_LIST)}'
             )
         )
         
@@ -6,26 +6,38 @@ from django.utils.translation import gettext_lazy as _
 from core.models import BaseModel
 
 
-class SKU(BaseModel):
-    """Stock Keeping Unit for fruits and vegetables."""
+class SKUManager(models.Manager):
+    """Manager for SKUs with a narrow queryset for lists and dropdowns."""
+    
+    def listing(self):
+        """SKUs without the columns list views never render."""
+        return self.defer('image', 'description', 'min_order_quantity')
+
+
+class Unit(models.TextChoices):
+    """Units of measurement an SKU is sold in."""
     
-    UNIT_CHOICES = [
-        ('kg', _('Kilogram')),
-        ('gram', _('Gram')),
-        ('quintal', _('Quintal')),
-        ('ton', _('Ton')),
-        ('piece', _('Piece')),
-        ('dozen', _('Dozen')),
-        ('bundle', _('Bundle')),
-    ]
+    KG = 'kg', _('Kilogram')
+    GRAM = 'gram', _('Gram')
+    QUINTAL = 'quintal', _('Quintal')
+    TON = 'ton', _('Ton')
+    PIECE = 'piece', _('Piece')
+    DOZEN = 'dozen', _('Dozen')
+    BUNDLE = 'bundle', _('Bundle')
+
+
+class Category(models.TextChoices):
+    """Product categories for SKUs."""
     
-    CATEGORY_CHOICES = [
-        ('fruit', _('Fruit')),
-        ('vegetable', _('Vegetable')),
-        ('grain', _('Grain')),
-        ('spice', _('Spice')),
-        ('other', _('Other')),
-    ]
+    FRUIT = 'fruit', _('Fruit')
+    VEGETABLE = 'vegetable', _('Vegetable')
+    GRAIN = 'grain', _('Grain')
+    SPICE = 'spice', _('Spice')
+    OTHER = 'other', _('Other')
+
+
+class SKU(BaseModel):
+    """Stock Keeping Unit for fruits and vegetables."""
     
     code = models.CharField(
         max_length=20,
@@ -48,14 +60,14 @@ class SKU(BaseModel):
     )
     category = models.CharField(
         max_length=20,
-        choices=CATEGORY_CHOICES,
-        default='vegetable',
+        choices=Category.choices,
+        default=Category.VEGETABLE,
         verbose_name=_('Category')
     )
     unit = models.CharField(
         max_length=20,
-        choices=UNIT_CHOICES,
-        default='kg',
+        choices=Unit.choices,
+        default=Unit.KG,
         verbose_name=_('Unit of Measurement')
     )
     description = models.TextField(
@@ -79,6 +91,8 @@ class SKU(BaseModel):
         verbose_name=_('Minimum Order Quantity')
     )
     
+    objects = SKUManager()
+    
     class Meta:
         verbose_name = _('SKU')
         verbose_name_plural = _('SKUs')
@@ -95,21 +109,53 @@ class SKU(BaseModel):
             return self.name_hi
         return self.name
     
-    @property
-    def latest_price_by_region(self):
-        """Get latest prices for this SKU grouped by region."""
-        from pricing.models import FarmerPrice
+    @staticmethod
+    def latest_prices_cache_key(sku_id, day=None):
+        """Cache key for an SKU's recent prices on the given day (default today)."""
+        from django.utils import timezone
+        
+        day = day or timezone.now().date()
+        return f'sku_prices_v1:{sku_id}:{day.isoformat()}'
+    
+    def get_latest_price_by_region(self):
+        """Get latest prices for this SKU grouped by region (cached for 5 minutes)."""
+        from django.core.cache import cache
         from django.utils import timezone
         from datetime import timedelta
         
-        # Get prices from last 7 days
-        cutoff_date = timezone.now().date() - timedelta(days=7)
+        today = timezone.now().date()
+        
+        def fetch():
+            from pricing.models import FarmerPrice
+            
+            # Get prices from last 7 days
+            cutoff_date = today - timedelta(days=7)
+            
+            # Ordering on region_id (not Region.name) lets
+            # fp_sku_region_date_price_idx return rows already sorted
+            rows = FarmerPrice.objects.filter(
+                sku=self,
+                date__gte=cutoff_date,
+                deleted_at__isnull=True
+            ).order_by('region_id', '-date', 'price').values(
+                'id', 'date', 'price', 'region__name',
+                'farmer__user__first_name', 'farmer__user__last_name', 'farmer__user__username',
+            )
+            return [
+                {
+                    'id': row['id'],
+                    'farmer_name': (
+                        f"{row['farmer__user__first_name']} {row['farmer__user__last_name']}".strip()
+                        or row['farmer__user__username']
+                    ),
+                    'region_name': row['region__name'],
+                    'date': row['date'],
+                    'price': row['price'],
+                }
+                for row in rows
+            ]
         
-        return FarmerPrice.objects.filter(
-            sku=self,
-            date__gte=cutoff_date,
-            deleted_at__isnull=True
-        ).select_related('farmer', 'region').order_by('region', '-date', 'price')
+        return cache.get_or_set(self.latest_prices_cache_key(self.pk, today), fetch, 300)
 
 
 class SKUImage(BaseModel):
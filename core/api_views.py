@@ -1,142 +1,313 @@
-from django.http import JsonResponse
+import datetime
+import time
+from functools import lru_cache, wraps
+
+import orjson
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
+from django.http import HttpResponse
 from django.contrib.auth.decorators import login_required
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import condition, require_http_methods
 from accounts.models import User
 
-try:
-    from regions.models import Region
-except ImportError:
-    Region = None
 
-try:
-    from catalog.models import SKU
-except ImportError:
-    SKU = None
+@lru_cache(maxsize=None)
+def get_model(app_label, model_name):
+    """Installed model class, or None if its app isn't installed (resolved once)."""
+    try:
+        return apps.get_model(app_label, model_name)
+    except LookupError:
+        return None
+
+def require_model(app_label, model_name):
+    """Answer 503 instead of calling the view when the model isn't installed."""
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            if get_model(app_label, model_name) is None:
+                return orjson_response(
+                    {'error': f'{model_name} model not available'}, status=503
+                )
+            return view_func(request, *args, **kwargs)
+        return _wrapped_view
+    return decorator
+
+
+def orjson_response(data, status=200):
+    """JSON response serialized with orjson (Decimals and lazy strings as str)."""
+    return HttpResponse(
+        orjson.dumps(data, default=str),
+        status=status,
+        content_type='application/json'
+    )
+
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 200
+
+def _page_params(request):
+    """Parse ?after_id=&limit= keyset pagination parameters (ValueError if malformed)."""
+    after_id = request.GET.get('after_id')
+    after_id = int(after_id) if after_id else None
+    limit = int(request.GET.get('limit', API_PAGE_SIZE))
+    return after_id, max(1, min(limit, API_MAX_PAGE_SIZE))
+
+def _fetch_page(queryset, limit):
+    """Return up to ``limit`` rows and whether more rows follow them."""
+    rows = list(queryset[:limit + 1])
+    return rows[:limit], len(rows) > limit
+
+def _bad_page_params(message='after_id and limit must be integers'):
+    return orjson_response({'error': message}, status=400)
+
+def _display_name(user_path):
+    """DB expression for User.get_full_name(), falling back to the username."""
+    return Coalesce(
+        NullIf(
+            Trim(Concat(f'{user_path}__first_name', Value(' '), f'{user_path}__last_name')),
+            Value(''),
+        ),
+        f'{user_path}__username',
+    )
+
+API_ETAG_VERSION_KEY = 'api:{name}:version'
+API_ETAG_TIMEOUT = 60  # seconds
+
+def invalidate_api_etag(name):
+    """Retire every ETag handed out by the named list API."""
+    cache.set(API_ETAG_VERSION_KEY.format(name=name), time.time_ns(), None)
 
-try:
-    from farmers.models import Farmer
-except ImportError:
-    Farmer = None
+def _weak_etag(name, request):
+    """Weak ETag from the API's data version and the page's query string."""
+    # Bumped by core.signals when the rows behind the API change; a
+    # timestamp version can't repeat, even if the key is evicted. The time
+    # bucket retires the tag anyway, for writes that send no signals
+    # (bulk_create, update()) or land in another process's cache.
+    version = cache.get_or_set(API_ETAG_VERSION_KEY.format(name=name), time.time_ns, None)
+    bucket = int(time.time() // API_ETAG_TIMEOUT)
+    return f'W/"{name}-{version}-{bucket}-{request.GET.urlencode()}"'
 
-try:
-    from pricing.models import FarmerPrice
-except ImportError:
-    FarmerPrice = None
+def _farmers_etag(request):
+    return _weak_etag('farmers', request)
 
-try:
-    from orders.models import Order
-except ImportError:
-    Order = None
+def _prices_etag(request):
+    return _weak_etag('prices', request)
 
 @login_required
 @require_http_methods(["GET"])
+@require_model('farmers', 'Farmer')
+@condition(etag_func=_farmers_etag)
 def farmers_api(request):
     """API endpoint to get farmers data"""
-    if not Farmer:
-        return JsonResponse([{'error': 'Farmers model not available'}], safe=False)
+    try:
+        after_id, limit = _page_params(request)
+    except ValueError:
+        return _bad_page_params()
     
-    farmers = Farmer.objects.select_related('region', 'user').all()
+    farmers = get_model('farmers', 'Farmer').objects.values(
+        'id', 'contact_number', 'farm_size', 'verified_at', 'created_at', 'region__name',
+        name=_display_name('user'),
+    ).order_by('id')
+    if after_id is not None:
+        farmers = farmers.filter(id__gt=after_id)
+    farmers, has_more = _fetch_page(farmers, limit)
     
-    farmers_data = []
-    for farmer in farmers:
-        farmers_data.append({
-            'id': farmer.id,
-            'farmer_id': farmer.farmer_id,
-            'name': farmer.user.get_full_name() or farmer.user.username if farmer.user else 'Unknown',
-            'phone': farmer.contact_number,
-            'region': farmer.region.name if farmer.region else '-',
-            'farm_size': str(farmer.farm_size) if farmer.farm_size else '-',
-            'is_verified': farmer.is_verified,
-            'created_at': farmer.created_at.strftime('%Y-%m-%d %H:%M') if hasattr(farmer, 'created_at') else '-',
-        })
+    farmers_data = [
+        {
+            'id': f['id'],
+            'farmer_id': f"F{f['id']:04d}",
+            'name': f['name'],
+            'phone': f['contact_number'],
+            'region': f['region__name'] or '-',
+            'farm_size': str(f['farm_size']) if f['farm_size'] else '-',
+            'is_verified': f['verified_at'] is not None,
+            'created_at': f['created_at'].strftime('%Y-%m-%d %H:%M'),
+        }
+        for f in farmers
+    ]
     
-    return JsonResponse(farmers_data, safe=False)
+    return orjson_response({
+        'results': farmers_data,
+        'next_after_id': farmers[-1]['id'] if has_more else None,
+    })
 
 @login_required
 @require_http_methods(["GET"])
+@require_model('pricing', 'FarmerPrice')
+@condition(etag_func=_prices_etag)
 def prices_api(request):
     """API endpoint to get prices data"""
-    if not FarmerPrice:
-        return JsonResponse([{'error': 'FarmerPrice model not available'}], safe=False)
+    try:
+        after_id, limit = _page_params(request)
+        after_date = request.GET.get('after_date')
+        after_date = datetime.date.fromisoformat(after_date) if after_date else None
+    except ValueError:
+        return _bad_page_params('after_date must be YYYY-MM-DD; after_id and limit integers')
+    if (after_id is None) != (after_date is None):
+        return _bad_page_params('after_date and after_id must be given together')
     
-    prices = FarmerPrice.objects.select_related('farmer__user', 'sku').all()[:50]  # Limit to 50 for performance
+    # Newest first, so the cursor is the (date, id) of the last row seen
+    prices = get_model('pricing', 'FarmerPrice').objects.values(
+        'id', 'price', 'date', 'quantity_available', 'sku__name',
+        farmer_name=_display_name('farmer__user'),
+    ).order_by('-date', '-id')
+    if after_id is not None:
+        prices = prices.filter(Q(date__lt=after_date) | Q(date=after_date, id__lt=after_id))
+    prices, has_more = _fetch_page(prices, limit)
     
-    prices_data = []
-    for price in prices:
-        farmer_name = '-'
-        if price.farmer and price.farmer.user:
-            farmer_name = price.farmer.user.get_full_name() or price.farmer.user.username
-        
-        prices_data.append({
-            'id': price.id,
-            'farmer': farmer_name,
-            'sku': price.sku.name if price.sku else '-',
-            'price': f'₹{price.price}' if hasattr(price, 'price') else '-',
-            'date': price.date.strftime('%Y-%m-%d') if hasattr(price, 'date') else (price.created_at.strftime('%Y-%m-%d') if hasattr(price, 'created_at') else '-'),
-            'quantity_available': f'{price.quantity_available} kg' if price.quantity_available else '-',
-        })
+    prices_data = [
+        {
+            'id': p['id'],
+            'farmer': p['farmer_name'],
+            'sku': p['sku__name'] or '-',
+            'price': '₹' + str(p['price']),
+            'date': p['date'].isoformat(),
+            'quantity_available': str(p['quantity_available']) + ' kg' if p['quantity_available'] else '-',
+        }
+        for p in prices
+    ]
     
-    return JsonResponse(prices_data, safe=False)
+    return orjson_response({
+        'results': prices_data,
+        'next_after_date': prices[-1]['date'].isoformat() if has_more else None,
+        'next_after_id': prices[-1]['id'] if has_more else None,
+    })
 
 @login_required
 @require_http_methods(["GET"])
+@require_model('orders', 'Order')
 def orders_api(request):
     """API endpoint to get orders data"""
-    if not Order:
-        return JsonResponse([{'error': 'Order model not available'}], safe=False)
+    try:
+        after_id, limit = _page_params(request)
+    except ValueError:
+        return _bad_page_params()
     
-    orders = Order.objects.select_related('farmer__user', 'sku').all()[:50]  # Limit to 50 for performance
+    # Newest first: ids grow with creation time
+    orders = get_model('orders', 'Order').objects.values(
+        'id', 'order_number', 'quantity', 'unit_price', 'status', 'created_at', 'sku__name',
+        farmer_name=_display_name('farmer__user'),
+    ).order_by('-id')
+    if after_id is not None:
+        orders = orders.filter(id__lt=after_id)
+    orders, has_more = _fetch_page(orders, limit)
     
-    orders_data = []
-    for order in orders:
-        farmer_name = '-'
-        if order.farmer and order.farmer.user:
-            farmer_name = order.farmer.user.get_full_name() or order.farmer.user.username
-        
-        orders_data.append({
-            'id': order.id,
-            'order_number': getattr(order, 'order_number', '-'),
-            'farmer': farmer_name,
-            'sku': order.sku.name if order.sku else '-',
-            'quantity': f'{order.quantity} kg' if hasattr(order, 'quantity') else '-',
-            'unit_price': f'₹{order.unit_price}' if hasattr(order, 'unit_price') else '-',
-            'total_value': f'₹{order.total_value}' if hasattr(order, 'total_value') else '-',
-            'status': getattr(order, 'status', '-'),
-            'date': order.created_at.strftime('%Y-%m-%d') if hasattr(order, 'created_at') else '-',
-        })
+    orders_data = [
+        {
+            'id': o['id'],
+            'order_number': o['order_number'],
+            'farmer': o['farmer_name'],
+            'sku': o['sku__name'] or '-',
+            'quantity': str(o['quantity']) + ' kg',
+            'unit_price': '₹' + str(o['unit_price']),
+            'total_value': '-',  # Order has no total_value field
+            'status': o['status'],
+            'date': o['created_at'].date().isoformat(),
+        }
+        for o in orders
+    ]
     
-    return JsonResponse(orders_data, safe=False)
+    return orjson_response({
+        'results': orders_data,
+        'next_after_id': orders[-1]['id'] if has_more else None,
+    })
 
 @login_required
 @require_http_methods(["GET"])
 def users_api(request):
     """API endpoint to get users data"""
-    users = User.objects.all()
+    try:
+        after_id, limit = _page_params(request)
+    except ValueError:
+        return _bad_page_params()
     
-    users_data = []
-    for user in users:
-        users_data.append({
-            'id': user.id,
-            'username': user.username,
-            'email': user.email,
-            'role': user.role,
-            'is_active': user.is_active,
-            'date_joined': user.date_joined.strftime('%Y-%m-%d'),
-        })
+    users = User.objects.values(
+        'id', 'username', 'email', 'role', 'is_active', 'date_joined'
+    ).order_by('id')
+    if after_id is not None:
+        users = users.filter(id__gt=after_id)
+    users, has_more = _fetch_page(users, limit)
     
-    return JsonResponse(users_data, safe=False)
+    users_data = [
+        {
+            'id': u['id'],
+            'username': u['username'],
+            'email': u['email'],
+            'role': u['role'],
+            'is_active': u['is_active'],
+            'date_joined': u['date_joined'].date().isoformat(),
+        }
+        for u in users
+    ]
+    
+    return orjson_response({
+        'results': users_data,
+        'next_after_id': users[-1]['id'] if has_more else None,
+    })
+
+DASHBOARD_STATS_CACHE_KEY = 'dashboard_stats_v1'
+DASHBOARD_STATS_TIMEOUT = 60  # seconds
+
+# Large tables are shown with the planner's row estimate instead of an
+# exact COUNT(*), which has to scan the whole table. Below
+# EXACT_COUNT_BELOW rows the estimate is too rough to show and an exact
+# count is cheap, so those are still counted.
+ESTIMATED_DASHBOARD_STATS = {'total_users', 'total_farmers', 'total_orders', 'recent_prices'}
+EXACT_COUNT_BELOW = 10_000
+_ROW_ESTIMATE_SQL = {
+    'mysql': (
+        '(SELECT TABLE_ROWS FROM information_schema.TABLES '
+        'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s)'
+    ),
+    'postgresql': '(SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s))',
+}
+
+def _compute_dashboard_stats():
+    """Count every dashboard table in one round-trip using scalar subqueries."""
+    counted = {
+        'total_farmers': get_model('farmers', 'Farmer'),
+        'total_users': User,
+        'total_orders': get_model('orders', 'Order'),
+        'total_skus': get_model('catalog', 'SKU'),
+        'recent_prices': get_model('pricing', 'FarmerPrice'),
+        'regions': get_model('regions', 'Region'),
+    }
+    stats = dict.fromkeys(counted, 0)
+    available = [(key, model) for key, model in counted.items() if model]
+    estimate_sql = _ROW_ESTIMATE_SQL.get(connection.vendor)
+    
+    columns, params = [], []
+    for key, model in available:
+        table = model._meta.db_table
+        count_sql = f'(SELECT COUNT(*) FROM {connection.ops.quote_name(table)})'
+        if estimate_sql and key in ESTIMATED_DASHBOARD_STATS:
+            # Never-analysed tables report NULL (MySQL) or -1 (PostgreSQL),
+            # which also falls through to the exact count
+            columns.append(
+                f'CASE WHEN {estimate_sql} >= %s THEN {estimate_sql} ELSE {count_sql} END'
+            )
+            params.extend([table, EXACT_COUNT_BELOW, table])
+        else:
+            columns.append(count_sql)
+    
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT ' + ', '.join(columns), params)
+        row = cursor.fetchone()
+    
+    for (key, model), count in zip(available, row):
+        stats[key] = int(count)
+    return stats
+
+def get_dashboard_stats():
+    """Table counts shown on dashboards, cached for DASHBOARD_STATS_TIMEOUT."""
+    return cache.get_or_set(
+        DASHBOARD_STATS_CACHE_KEY, _compute_dashboard_stats, DASHBOARD_STATS_TIMEOUT
+    )
 
 @login_required
 @require_http_methods(["GET"])
 def dashboard_stats_api(request):
     """API endpoint to get dashboard statistics"""
-    stats = {
-        'total_farmers': Farmer.objects.count() if Farmer else 0,
-        'total_users': User.objects.count(),
-        'total_orders': Order.objects.count() if Order else 0,
-        'total_skus': SKU.objects.count() if SKU else 0,
-        'recent_prices': FarmerPrice.objects.count() if FarmerPrice else 0,
-        'regions': Region.objects.count() if Region else 0,
-    }
-    
-    return JsonResponse(stats)
+    return orjson_response(get_dashboard_stats())
@@ -2,10 +2,15 @@
 
 from django.conf import settings
 
+# Settings don't change at runtime, so the flags are read once at import.
+# The template engine copies processor output into its own context, so
+# sharing one dict between requests is safe.
+_FEATURE_FLAGS = {
+    'FEATURE_VOICE_INPUT': getattr(settings, 'FEATURE_VOICE_INPUT', False),
+    'FEATURE_RANKING': getattr(settings, 'FEATURE_RANKING', False),
+}
+
 
 def feature_flags(request):
     """Add feature flags to template context."""
-    return {
-        'FEATURE_VOICE_INPUT': getattr(settings, 'FEATURE_VOICE_INPUT', False),
-        'FEATURE_RANKING': getattr(settings, 'FEATURE_RANKING', False),
-    }
+    return _FEATURE_FLAGS
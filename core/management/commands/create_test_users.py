@@ -2,6 +2,7 @@
 
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.db import transaction
 from farmers.models import Farmer
 from regions.models import Region
@@ -85,13 +86,23 @@ class Command(BaseCommand):
             }
         ]
 
-        created_count = 0
+        # Hash each distinct password once; the fixtures all share one
+        password_hashes = {}
+        new_users = []
+        passwords = {}
+        
+        # One query for all the usernames that already exist
+        existing = set(
+            User.objects.filter(
+                username__in=[user_data['username'] for user_data in test_users]
+            ).values_list('username', flat=True)
+        )
         
         for user_data in test_users:
             username = user_data['username']
             
             # Check if user already exists
-            if User.objects.filter(username=username).exists():
+            if username in existing:
                 self.stdout.write(
                     self.style.WARNING(f'User {username} already exists, skipping...')
                 )
@@ -100,38 +111,54 @@ class Command(BaseCommand):
             # Extract region and password
             region_obj = user_data.pop('region', None)
             password = user_data.pop('password')
+            if password not in password_hashes:
+                password_hashes[password] = make_password(password)
+            passwords[username] = password
             
-            # Create user
-            user = User.objects.create_user(
-                password=password,
-                **user_data
+            # bulk_create skips User.save(), so normalise the email here
+            user_data['email'] = user_data['email'].lower()
+            new_users.append(
+                User(password=password_hashes[password], region=region_obj, **user_data)
             )
-            
-            # Set region if specified
-            if region_obj:
-                user.region = region_obj
-                user.save()
-            
-            # Create farmer profile if user is farmer
-            if user.role == 'farmer':
-                farmer, farmer_created = Farmer.objects.get_or_create(
+
+        User.objects.bulk_create(new_users, ignore_conflicts=True)
+        
+        # Re-read the rows: MySQL doesn't return primary keys from bulk inserts
+        created_users = User.objects.select_related('region').in_bulk(
+            [user.username for user in new_users], field_name='username'
+        )
+        
+        # Create farmer profiles for farmer users in one insert
+        Farmer.objects.bulk_create(
+            [
+                Farmer(
                     user=user,
-                    defaults={
-                        'region': region_obj,
-                        'contact_number': '+91-9876543210',
-                        'address': '123 Test Village, Test District',
-                        'is_active': True
-                    }
+                    region=user.region,
+                    contact_number='+91-9876543210',
+                    address='123 Test Village, Test District',
+                    is_active=True,
+                )
+                for user in created_users.values()
+                if user.role == 'farmer'
+            ],
+            ignore_conflicts=True,
+        )
+        
+        created_count = 0
+        for new_user in new_users:
+            user = created_users.get(new_user.username)
+            if user is None:
+                continue
+            if user.role == 'farmer':
+                self.stdout.write(
+                    self.style.SUCCESS(f'Created farmer profile for {user.username}')
                 )
-                if farmer_created:
-                    self.stdout.write(
-                        self.style.SUCCESS(f'Created farmer profile for {username}')
-                    )
             
             created_count += 1
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'Created user: {username} ({user.get_role_display()}) - Password: {password}'
+                    f'Created user: {user.username} ({user.get_role_display()}) - '
+                    f'Password: {passwords[user.username]}'
                 )
             )
 
@@ -11,6 +11,15 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _dir_entries(path):
+    """Names in a directory, read with one scandir (empty if it's missing)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
 class Command(BaseCommand):
     help = 'Build internationalization files for all configured languages'
 
@@ -76,31 +85,35 @@ class Command(BaseCommand):
         """Run makemessages for specified languages"""
         self.stdout.write('Running makemessages...')
         
-        for lang in languages:
-            try:
-                self.stdout.write(f'  Creating messages for {lang}...')
-                call_command(
-                    'makemessages',
-                    locale=[lang],
-                    verbosity=1,
-                    ignore_patterns=[
-                        'env/*',
-                        'venv/*',
-                        '*/migrations/*',
-                        'static/admin/*',
-                        'node_modules/*',
-                    ],
-                    extensions=['html', 'py', 'js'],
-                    add_location='file',
-                )
+        # One call for all locales: the sources are scanned by xgettext once
+        # and the result is merged into each language's .po file.
+        # makemessages writes temporary files next to the sources, so the
+        # locales must not be processed in parallel.
+        try:
+            self.stdout.write(f'  Creating messages for {", ".join(languages)}...')
+            call_command(
+                'makemessages',
+                locale=list(languages),
+                verbosity=1,
+                ignore_patterns=[
+                    'env/*',
+                    'venv/*',
+                    '*/migrations/*',
+                    'static/admin/*',
+                    'node_modules/*',
+                ],
+                extensions=['html', 'py', 'js'],
+                add_location='file',
+            )
+            for lang in languages:
                 self.stdout.write(
                     self.style.SUCCESS(f'  ✓ Messages created for {lang}')
                 )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'  ✗ Error creating messages for {lang}: {e}')
-                )
-                raise
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'  ✗ Error creating messages for {", ".join(languages)}: {e}')
+            )
+            raise
 
     def _run_compilemessages(self, languages, ignore_fuzzy=False):
         """Run compilemessages for specified languages"""
@@ -109,6 +122,7 @@ class Command(BaseCommand):
         # Check for missing translation files
         locale_dir = os.path.join(settings.BASE_DIR, 'locale')
         
+        to_compile = []
         for lang in languages:
             po_file = os.path.join(locale_dir, lang, 'LC_MESSAGES', 'django.po')
             if not os.path.exists(po_file):
@@ -119,26 +133,27 @@ class Command(BaseCommand):
                     )
                 )
                 continue
+            to_compile.append(lang)
+
+        compile_args = {
+            'verbosity': 1,
+        }
+        if ignore_fuzzy:
+            compile_args['ignore_fuzzy'] = True
 
+        # One call for all locales: compilemessages already runs msgfmt for
+        # every .po file on its own thread pool
+        if to_compile:
             try:
-                self.stdout.write(f'  Compiling messages for {lang}...')
-                
-                compile_args = {
-                    'locale': [lang],
-                    'verbosity': 1,
-                }
-                
-                if ignore_fuzzy:
-                    compile_args['ignore_fuzzy'] = True
-
-                call_command('compilemessages', **compile_args)
-                
-                self.stdout.write(
-                    self.style.SUCCESS(f'  ✓ Messages compiled for {lang}')
-                )
+                self.stdout.write(f'  Compiling messages for {", ".join(to_compile)}...')
+                call_command('compilemessages', locale=to_compile, **compile_args)
+                for lang in to_compile:
+                    self.stdout.write(
+                        self.style.SUCCESS(f'  ✓ Messages compiled for {lang}')
+                    )
             except Exception as e:
                 self.stdout.write(
-                    self.style.ERROR(f'  ✗ Error compiling messages for {lang}: {e}')
+                    self.style.ERROR(f'  ✗ Error compiling messages for {", ".join(to_compile)}: {e}')
                 )
                 raise
 
@@ -146,15 +161,15 @@ class Command(BaseCommand):
         self.stdout.write('\n' + '='*50)
         self.stdout.write('Translation files location:')
         for lang in languages:
-            po_file = os.path.join(locale_dir, lang, 'LC_MESSAGES', 'django.po')
-            mo_file = os.path.join(locale_dir, lang, 'LC_MESSAGES', 'django.mo')
+            messages_dir = os.path.join(locale_dir, lang, 'LC_MESSAGES')
+            entries = _dir_entries(messages_dir)
             
-            po_exists = '✓' if os.path.exists(po_file) else '✗'
-            mo_exists = '✓' if os.path.exists(mo_file) else '✗'
+            po_exists = '✓' if 'django.po' in entries else '✗'
+            mo_exists = '✓' if 'django.mo' in entries else '✗'
             
             self.stdout.write(f'  {lang}: .po {po_exists} | .mo {mo_exists}')
-            if os.path.exists(po_file):
-                self.stdout.write(f'       {po_file}')
+            if 'django.po' in entries:
+                self.stdout.write(f"       {os.path.join(messages_dir, 'django.po')}")
 
         self.stdout.write('\nNext steps:')
         self.stdout.write('1. Edit .po files to add/update translations')
@@ -3,10 +3,15 @@ Management command to seed the database with initial test data.
 Creates regions, SKUs, farmers, and sample data for testing.
 """
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from decimal import Decimal
+from functools import lru_cache
+import os
 import random
 from datetime import timedelta
 
@@ -18,19 +23,135 @@ from orders.models import Order
 
 User = get_user_model()
 
-# Behavior patterns for farmers - simple mapping
-FARMER_PATTERNS = {
-    'raman.kumar': 'high_performer',
-    'lakshmi.devi': 'high_performer',
-    'suresh.patel': 'consistent',
-    'meera.sharma': 'consistent',
-    'vijay.singh': 'consistent',
-    'prakash.reddy': 'unreliable_cheap',
-    'kavitha.nair': 'unreliable_cheap',
-    'arjun.krishnan': 'new_farmer',
+# Rows per INSERT statement when bulk-creating seed data
+BULK_BATCH_SIZE = int(os.environ.get('SEED_BULK_BATCH_SIZE', 500))
+
+# Random seed, so every run generates the same sample data
+SEED_DATA_SEED = int(os.environ.get('SEED_DATA_SEED', 42))
+
+# Worker threads for independent seed sections (1 runs them serially)
+MAX_SEED_THREADS = int(os.environ.get('MAX_SEED_THREADS', 4))
+
+# (name, code, description) for each seeded region
+REGIONS = (
+    ('Tamil Nadu', 'TN', 'Southern region covering Tamil Nadu state'),
+    ('Karnataka', 'KA', 'Southern region covering Karnataka state'),
+    ('Andhra Pradesh', 'AP', 'Southern region covering Andhra Pradesh state'),
+)
+
+# (name, code, category, unit) for each seeded SKU
+SKUS = (
+    ('Tomato', 'TOM001', 'vegetable', 'kg'),
+    ('Onion', 'ONI001', 'vegetable', 'kg'),
+    ('Potato', 'POT001', 'vegetable', 'kg'),
+    ('Banana', 'BAN001', 'fruit', 'dozen'),
+    ('Apple', 'APP001', 'fruit', 'kg'),
+    ('Orange', 'ORA001', 'fruit', 'kg'),
+    ('Spinach', 'SPI001', 'vegetable', 'kg'),
+    ('Coriander', 'COR001', 'vegetable', 'kg'),
+    ('Green Chili', 'CHI001', 'vegetable', 'kg'),
+    ('Carrot', 'CAR001', 'vegetable', 'kg'),
+)
+
+# (name, phone, region index, behavior pattern) for each seeded farmer
+FARMERS = (
+    # High performers
+    ('Raman Kumar', '9876543210', 0, 'high_performer'),
+    ('Lakshmi Devi', '9876543211', 0, 'high_performer'),
+
+    # Consistent mid-range
+    ('Suresh Patel', '9876543212', 1, 'consistent'),
+    ('Meera Sharma', '9876543213', 1, 'consistent'),
+    ('Vijay Singh', '9876543214', 2, 'consistent'),
+
+    # Unreliable but cheap
+    ('Prakash Reddy', '9876543215', 2, 'unreliable_cheap'),
+    ('Kavitha Nair', '9876543216', 0, 'unreliable_cheap'),
+
+    # New farmer
+    ('Arjun Krishnan', '9876543217', 1, 'new_farmer'),
+)
+
+
+def farmer_username(name):
+    """Username a seeded farmer is created with, e.g. 'raman.kumar'."""
+    return name.lower().replace(' ', '.')
+
+
+# Behavior pattern for each seeded farmer's username
+FARMER_PATTERNS = {farmer_username(name): pattern for name, _, _, pattern in FARMERS}
+
+# Default base price; SKU doesn't have min/max prices yet
+BASE_PRICE = 50.0
+
+# Range of multipliers on the base price for each behavior pattern
+PRICE_MULTIPLIERS = {
+    'high_performer': (0.9, 1.1),  # Competitive but fair prices
+    'consistent': (0.95, 1.05),  # Consistent mid-range prices
+    'unreliable_cheap': (0.7, 0.9),  # Very low prices but unreliable
+    'new_farmer': (1.1, 1.3),  # Higher prices due to inexperience
 }
 
 
+def random_amount(low, high):
+    """Random Decimal between low and high with the two places the columns store."""
+    return Decimal(f'{random.uniform(low, high):.2f}')
+
+
+@lru_cache(maxsize=None)
+def hashed_password(raw_password):
+    """Hash each seed password once per process, however many users share it."""
+    return make_password(raw_password)
+
+
+@contextmanager
+def foreign_key_checks_deferred():
+    """
+    Skip MySQL's per-row foreign key checks while loading seed rows whose
+    parents were created in the same transaction. PostgreSQL and SQLite
+    already defer Django's foreign keys to commit, so this is a no-op there.
+    """
+    if connection.vendor != 'mysql':
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('SET foreign_key_checks = 0')
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute('SET foreign_key_checks = 1')
+
+
+def relax_commit_durability():
+    """
+    Let PostgreSQL return from the current transaction's COMMIT without
+    waiting for its WAL flush; seed data can be regenerated if a crash loses
+    it. SET LOCAL ends with the transaction. MySQL only has a server-wide
+    equivalent and SQLite can't change it mid-transaction, so neither is
+    touched.
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL synchronous_commit = OFF')
+
+
+def run_seed_section(section, close_connection=True):
+    """
+    Run one seed section in its own transaction. Worker threads get their own
+    database connection, which must be closed when the section finishes or
+    each thread leaves one open behind.
+    """
+    try:
+        with transaction.atomic():
+            relax_commit_durability()
+            section()
+    finally:
+        if close_connection:
+            connection.close()
+
+
 class Command(BaseCommand):
     help = 'Seed database with initial test data'
 
@@ -51,14 +172,20 @@ class Command(BaseCommand):
             self.style.SUCCESS('Starting database seeding process')
         )
 
-        with transaction.atomic():
-            if options['clear']:
+        # One creation timestamp for every bulk-created row, rather than a
+        # timezone.now() call per instance from the created_at default
+        self.seeded_at = timezone.now()
+        random.seed(SEED_DATA_SEED)
+
+        if options['clear']:
+            with transaction.atomic():
                 self._clear_data()
 
-            if not options['farmers_only']:
-                self._create_regions()
-                self._create_skus()
-            
+        if not options['farmers_only']:
+            self._create_reference_data()
+
+        with transaction.atomic(), foreign_key_checks_deferred():
+            relax_commit_durability()
             self._create_users_and_farmers()
             self._create_sample_prices()
             self._create_sample_orders()
@@ -79,35 +206,35 @@ class Command(BaseCommand):
         SKU.objects.all().delete()
         Region.objects.all().delete()
 
+    def _create_reference_data(self):
+        """Create regions and SKUs, concurrently where the database allows it"""
+        sections = [self._create_regions, self._create_skus]
+
+        # SQLite allows a single writer, so threads would only contend for its lock
+        if MAX_SEED_THREADS < 2 or connection.vendor == 'sqlite':
+            for section in sections:
+                run_seed_section(section, close_connection=False)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_SEED_THREADS, len(sections))) as executor:
+            futures = [executor.submit(run_seed_section, section) for section in sections]
+        for future in futures:
+            # Re-raise the first failure once every section has finished
+            future.result()
+
     def _create_regions(self):
         """Create 3 test regions"""
         self.stdout.write('Creating regions...')
         
-        regions_data = [
-            {
-                'name': 'Tamil Nadu',
-                'code': 'TN',
-                'description': 'Southern region covering Tamil Nadu state',
-                'is_active': True,
-            },
-            {
-                'name': 'Karnataka',
-                'code': 'KA', 
-                'description': 'Southern region covering Karnataka state',
-                'is_active': True,
-            },
-            {
-                'name': 'Andhra Pradesh',
-                'code': 'AP',
-                'description': 'Southern region covering Andhra Pradesh state',
-                'is_active': True,
-            }
-        ]
-
-        for region_data in regions_data:
+        for name, code, description in REGIONS:
             region, created = Region.objects.get_or_create(
-                code=region_data['code'],
-                defaults=region_data
+                code=code,
+                defaults={
+                    'name': name,
+                    'code': code,
+                    'description': description,
+                    'is_active': True,
+                }
             )
             action = 'Created' if created else 'Found existing'
             self.stdout.write(f'  {action}: {region.name}')
@@ -116,27 +243,13 @@ class Command(BaseCommand):
         """Create 10 SKUs"""
         self.stdout.write('Creating SKUs...')
 
-        # Create SKUs
-        skus_data = [
-            {'name': 'Tomato', 'code': 'TOM001', 'category': 'vegetable', 'unit': 'kg'},
-            {'name': 'Onion', 'code': 'ONI001', 'category': 'vegetable', 'unit': 'kg'},
-            {'name': 'Potato', 'code': 'POT001', 'category': 'vegetable', 'unit': 'kg'},
-            {'name': 'Banana', 'code': 'BAN001', 'category': 'fruit', 'unit': 'dozen'},
-            {'name': 'Apple', 'code': 'APP001', 'category': 'fruit', 'unit': 'kg'},
-            {'name': 'Orange', 'code': 'ORA001', 'category': 'fruit', 'unit': 'kg'},
-            {'name': 'Spinach', 'code': 'SPI001', 'category': 'vegetable', 'unit': 'kg'},
-            {'name': 'Coriander', 'code': 'COR001', 'category': 'vegetable', 'unit': 'kg'},
-            {'name': 'Green Chili', 'code': 'CHI001', 'category': 'vegetable', 'unit': 'kg'},
-            {'name': 'Carrot', 'code': 'CAR001', 'category': 'vegetable', 'unit': 'kg'},
-        ]
-
-        for sku_data in skus_data:
+        for name, code, category, unit in SKUS:
             sku, created = SKU.objects.get_or_create(
-                code=sku_data['code'],
+                code=code,
                 defaults={
-                    'name': sku_data['name'],
-                    'category': sku_data['category'],
-                    'unit': sku_data['unit'],
+                    'name': name,
+                    'category': category,
+                    'unit': unit,
                     'is_active': True,
                 }
             )
@@ -154,120 +267,138 @@ class Command(BaseCommand):
             )
             return
 
-        # Create admin user
-        admin_user, created = User.objects.get_or_create(
-            username='admin',
-            defaults={
-                'email': 'admin@kannammalagro.com',
-                'first_name': 'Admin',
-                'last_name': 'User',
-                'role': 'admin',
-                'is_staff': True,
-                'is_superuser': True,
-                'region': regions[0],
-            }
-        )
-        if created:
-            admin_user.set_password('admin123')
-            admin_user.save()
-            self.stdout.write('  Created admin user: admin@kannammalagro.com')
-
-        # Create buyer heads for each region
+        # (user fields, password, message) for the admin, one buyer head
+        # per region and every farmer
+        users_data = [
+            (
+                {
+                    'username': 'admin',
+                    'email': 'admin@kannammalagro.com',
+                    'first_name': 'Admin',
+                    'last_name': 'User',
+                    'role': 'admin',
+                    'is_staff': True,
+                    'is_superuser': True,
+                    'region': regions[0],
+                },
+                'admin123',
+                '  Created admin user: admin@kannammalagro.com',
+            )
+        ]
         for i, region in enumerate(regions):
-            buyer_user, created = User.objects.get_or_create(
-                username=f'buyer{i+1}',
-                defaults={
+            users_data.append((
+                {
+                    'username': f'buyer{i+1}',
                     'email': f'buyer{i+1}@kannammalagro.com',
                     'first_name': f'Buyer{i+1}',
                     'last_name': 'Head',
                     'role': 'buyer_head',
                     'region': region,
-                }
-            )
-            if created:
-                buyer_user.set_password('buyer123')
-                buyer_user.save()
-                self.stdout.write(f'  Created buyer head: {buyer_user.email}')
-
-        # Create farmers with different behavior patterns
-        farmers_data = [
-            # High performers
-            {'name': 'Raman Kumar', 'phone': '9876543210', 'region_idx': 0, 'pattern': 'high_performer'},
-            {'name': 'Lakshmi Devi', 'phone': '9876543211', 'region_idx': 0, 'pattern': 'high_performer'},
-            
-            # Consistent mid-range
-            {'name': 'Suresh Patel', 'phone': '9876543212', 'region_idx': 1, 'pattern': 'consistent'},
-            {'name': 'Meera Sharma', 'phone': '9876543213', 'region_idx': 1, 'pattern': 'consistent'},
-            {'name': 'Vijay Singh', 'phone': '9876543214', 'region_idx': 2, 'pattern': 'consistent'},
-            
-            # Unreliable but cheap
-            {'name': 'Prakash Reddy', 'phone': '9876543215', 'region_idx': 2, 'pattern': 'unreliable_cheap'},
-            {'name': 'Kavitha Nair', 'phone': '9876543216', 'region_idx': 0, 'pattern': 'unreliable_cheap'},
-            
-            # New farmer
-            {'name': 'Arjun Krishnan', 'phone': '9876543217', 'region_idx': 1, 'pattern': 'new_farmer'},
+                },
+                'buyer123',
+                f'  Created buyer head: buyer{i+1}@kannammalagro.com',
+            ))
+        for name, _, region_idx, _ in FARMERS:
+            first_name, _, last_name = name.partition(' ')
+            users_data.append((
+                {
+                    'username': farmer_username(name),
+                    'email': f'{farmer_username(name)}@farmer.com',
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'role': 'farmer',
+                    'region': regions[region_idx],
+                },
+                'farmer123',
+                None,
+            ))
+
+        existing = set(
+            User.objects.filter(
+                username__in=[fields['username'] for fields, _, _ in users_data]
+            ).values_list('username', flat=True)
+        )
+
+        new_users = [
+            User(password=hashed_password(password), **fields)
+            for fields, password, _ in users_data
+            if fields['username'] not in existing
         ]
 
-        for farmer_data in farmers_data:
-            region = regions[farmer_data['region_idx']]
-            email = f"{farmer_data['name'].lower().replace(' ', '.')}@farmer.com"
-            username = farmer_data['name'].lower().replace(' ', '.')
-            
-            user, created = User.objects.get_or_create(
-                username=username,
-                defaults={
-                    'email': email,
-                    'first_name': farmer_data['name'].split()[0],
-                    'last_name': ' '.join(farmer_data['name'].split()[1:]),
-                    'role': 'farmer',
-                    'region': region,
-                }
-            )
-            
-            if created:
-                user.set_password('farmer123')
-                user.save()
-
-                farmer, created = Farmer.objects.get_or_create(
-                    user=user,
-                    defaults={
-                        'contact_number': farmer_data['phone'],
-                        'region': region,
-                        'farm_size': Decimal(str(random.uniform(1.0, 10.0))),
-                        'farm_type': random.choice([
-                            'Vegetable',
-                            'Fruit', 
-                            'Mixed',
-                            'Organic'
-                        ]),
-                        'address': f'{farmer_data["name"]}, {region.name}',
-                        'is_active': farmer_data['pattern'] != 'new_farmer',
-                    }
-                )
-                self.stdout.write(f'  Created farmer: {farmer_data["name"]} ({region.code})')
+        User.objects.bulk_create(new_users, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+
+        # Re-read the rows: MySQL doesn't return primary keys from bulk inserts
+        created_users = User.objects.in_bulk(
+            [user.username for user in new_users], field_name='username'
+        )
+        for fields, _, message in users_data:
+            if message and fields['username'] in created_users:
+                self.stdout.write(message)
+
+        # Farmer profiles for the farmer users created above
+        farmers = []
+        for name, phone, region_idx, pattern in FARMERS:
+            user = created_users.get(farmer_username(name))
+            if user is None:
+                continue
+            region = regions[region_idx]
+            farmers.append(Farmer(
+                user=user,
+                contact_number=phone,
+                region=region,
+                farm_size=random_amount(1.0, 10.0),
+                farm_type=random.choice([
+                    'Vegetable',
+                    'Fruit', 
+                    'Mixed',
+                    'Organic'
+                ]),
+                address=f'{name}, {region.name}',
+                is_active=pattern != 'new_farmer',
+                created_at=self.seeded_at,
+            ))
+            self.stdout.write(f'  Created farmer: {name} ({region.code})')
+
+        Farmer.objects.bulk_create(farmers, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
 
     def _create_sample_prices(self):
         """Create sample price submissions with different patterns"""
         self.stdout.write('Creating sample price data...')
 
-        farmers = Farmer.objects.all()
-        skus = SKU.objects.all()
+        farmers = list(Farmer.objects.select_related('user', 'region'))
+        skus = list(SKU.objects.all())
+        sku_count = len(skus)
         
         if not farmers or not skus:
             self.stdout.write('No farmers or SKUs found, skipping price creation')
             return
 
-        # Create prices for last 30 days
+        # Resolve each farmer's behavior pattern once, not per SKU per day
+        pattern_by_farmer = {
+            farmer.id: FARMER_PATTERNS.get(farmer.user.username, 'consistent')
+            for farmer in farmers
+        }
+
+        # Create prices for last 30 days, skipping (farmer, sku, date) keys
+        # that a previous run already seeded
+        today = self.seeded_at.date()
+        existing_keys = set(
+            FarmerPrice.objects.filter(date__gt=today - timedelta(days=30))
+            .values_list('farmer_id', 'sku_id', 'date')
+        )
+        prices = []
         for day_offset in range(30):
-            date = timezone.now().date() - timedelta(days=day_offset)
+            date = today - timedelta(days=day_offset)
             
             for farmer in farmers:
                 # Each farmer submits 2-4 SKUs per day randomly
-                farmer_skus = random.sample(list(skus), random.randint(2, 4))
-                
-                for sku in farmer_skus:
+                for sku_idx in random.sample(range(sku_count), random.randint(2, 4)):
+                    sku = skus[sku_idx]
+                    if (farmer.id, sku.id, date) in existing_keys:
+                        continue
+                    
                     # Skip some days for unreliable farmers
-                    pattern = FARMER_PATTERNS.get(farmer.user.username, 'consistent')
+                    pattern = pattern_by_farmer[farmer.id]
                     if pattern == 'unreliable_cheap' and random.random() < 0.4:
                         continue
                     
@@ -275,87 +406,79 @@ class Command(BaseCommand):
                     if pattern == 'new_farmer' and day_offset > 5:
                         continue
 
-                    price = self._generate_price_for_farmer_pattern(farmer, sku)
-                    quality_rating = self._generate_quality_for_farmer_pattern(farmer)
+                    price = self._generate_price_for_farmer_pattern(pattern)
                     
-                    FarmerPrice.objects.get_or_create(
+                    prices.append(FarmerPrice(
                         farmer=farmer,
                         sku=sku,
                         date=date,
-                        defaults={
-                            'price': price,
-                            'quantity_available': Decimal(str(random.uniform(10.0, 500.0))),
-                            'region': farmer.region,
-                            'submitted_via': random.choice(['voice', 'text']),
-                            'notes': f'Sample price data for {sku.name}',
-                        }
-                    )
-
-        self.stdout.write(f'  Created price data for {farmers.count()} farmers')
-
-    def _generate_price_for_farmer_pattern(self, farmer, sku):
+                        price=price,
+                        quantity_available=random_amount(10.0, 500.0),
+                        region=farmer.region,
+                        submitted_via=random.choice(['voice', 'text']),
+                        notes=f'Sample price data for {sku.name}',
+                        created_at=self.seeded_at,
+                    ))
+
+        # ignore_conflicts still guards against rows added since the key scan
+        FarmerPrice.objects.bulk_create(prices, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+
+        self.stdout.write(f'  Created price data for {len(farmers)} farmers')
+
+    def _generate_price_for_farmer_pattern(self, pattern):
         """Generate price based on farmer behavior pattern"""
-        # For now, generate simple random prices since SKU doesn't have min/max price
-        base_price = Decimal('50.00')  # Default base price
-        pattern = FARMER_PATTERNS.get(farmer.user.username, 'consistent')
-        
-        if pattern == 'high_performer':
-            # Competitive but fair prices
-            return Decimal(str(float(base_price) * random.uniform(0.9, 1.1)))
-        elif pattern == 'consistent':
-            # Consistent mid-range prices
-            return Decimal(str(float(base_price) * random.uniform(0.95, 1.05)))
-        elif pattern == 'unreliable_cheap':
-            # Very low prices but unreliable
-            return Decimal(str(float(base_price) * random.uniform(0.7, 0.9)))
-        else:  # new_farmer
-            # Higher prices due to inexperience
-            return Decimal(str(float(base_price) * random.uniform(1.1, 1.3)))
-
-    def _generate_quality_for_farmer_pattern(self, farmer):
-        """Generate quality rating based on farmer pattern"""
-        pattern = FARMER_PATTERNS.get(farmer.user.username, 'consistent')
-        if pattern == 'high_performer':
-            return random.uniform(4.0, 5.0)
-        elif pattern == 'consistent':
-            return random.uniform(3.5, 4.5)
-        elif pattern == 'unreliable_cheap':
-            return random.uniform(2.0, 3.5)
-        else:  # new_farmer
-            return random.uniform(3.0, 4.0)
+        low, high = PRICE_MULTIPLIERS.get(pattern, PRICE_MULTIPLIERS['new_farmer'])
+        return random_amount(BASE_PRICE * low, BASE_PRICE * high)
 
     def _create_sample_orders(self):
         """Create sample orders"""
         self.stdout.write('Creating sample orders...')
 
-        buyer_heads = User.objects.filter(role='buyer_head')
-        farmers = list(Farmer.objects.all())
+        buyer_heads = list(User.objects.filter(role='buyer_head'))
+        # The loop reads farmer.user (pattern) and farmer.region for each order
+        farmers = list(Farmer.objects.select_related('user', 'region'))
         skus = list(SKU.objects.all())
 
         if not buyer_heads or not farmers or not skus:
             return
 
         # Create 20 sample orders over last 15 days
+        orders = []
         for _ in range(20):
-            buyer_heads = [u for u in User.objects.filter(role='procurement_head')]
-            buyer = random.choice(buyer_heads) if buyer_heads else None
+            buyer = random.choice(buyer_heads)
             farmer = random.choice(farmers)
             sku = random.choice(skus)
-            quantity = Decimal(str(random.uniform(10.0, 100.0)))
-            unit_price = self._generate_price_for_farmer_pattern(farmer, sku)
+            quantity = random_amount(10.0, 100.0)
+            unit_price = self._generate_price_for_farmer_pattern(
+                FARMER_PATTERNS.get(farmer.user.username, 'consistent')
+            )
             total_amount = quantity * unit_price
 
-            if buyer:
-                order = Order.objects.create(
-                    order_number=f'ORD{random.randint(1000, 9999)}',
-                    sku=sku,
-                    farmer=farmer,
-                    region=farmer.region,
-                    quantity=quantity,
-                    unit_price=unit_price,
-                    total_amount=total_amount,
-                    ordered_by=buyer,
-                    status=random.choice(['pending', 'confirmed', 'delivered', 'cancelled']),
-                )
-
-        self.stdout.write(f'  Created {Order.objects.count()} sample orders')
+            orders.append(Order(
+                order_number=f'ORD{random.randint(1000, 9999)}',
+                sku=sku,
+                farmer=farmer,
+                region=farmer.region,
+                quantity=quantity,
+                unit_price=unit_price,
+                total_amount=total_amount,
+                ordered_by=buyer,
+                status=random.choice(['pending', 'confirmed', 'delivered', 'cancelled']),
+                created_at=self.seeded_at,
+            ))
+
+        # Drop random order numbers that clash with each other or with
+        # existing orders, so the orders inserted are the ones counted
+        orders_by_number = {order.order_number: order for order in orders}
+        taken = set(
+            Order.objects.filter(order_number__in=orders_by_number)
+            .values_list('order_number', flat=True)
+        )
+        new_orders = [
+            order for number, order in orders_by_number.items() if number not in taken
+        ]
+        Order.objects.bulk_create(new_orders, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+        # bulk_create skips the signals that keep Farmer.total_orders current
+        Farmer.recount_total_orders()
+
+        self.stdout.write(f'  Created {len(new_orders)} sample orders')
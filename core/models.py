@@ -13,6 +13,13 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+class AliveManager(models.Manager):
+    """Manager that only returns rows which haven't been soft deleted."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class SoftDeleteModel(models.Model):
     """Abstract base model with soft delete functionality."""
     deleted_at = models.DateTimeField(null=True, blank=True)
@@ -24,6 +31,9 @@ class SoftDeleteModel(models.Model):
         related_name='%(class)s_deleted_by'
     )
 
+    objects = models.Manager()
+    alive = AliveManager()
+
     class Meta:
         abstract = True
 
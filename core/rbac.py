@@ -11,12 +11,19 @@ class RoleRequiredMixin(LoginRequiredMixin):
     """Mixin to require specific roles for access."""
     
     required_roles = []  # List of roles that can access this view
+    _required_role_set = frozenset()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Freeze the roles once per view class; dispatch is a set lookup
+        cls._required_role_set = frozenset(cls.required_roles)
     
     def dispatch(self, request, *args, **kwargs):
         if not request.user.is_authenticated:
             return self.handle_no_permission()
         
-        if not any(getattr(request.user, f'is_{role}', False) for role in self.required_roles):
+        # is_<role> is true exactly when user.role == <role>
+        if request.user.role not in self._required_role_set:
             messages.error(request, 'You do not have permission to access this page.')
             return redirect('dashboard')
         
@@ -50,13 +57,16 @@ class FarmerRequiredMixin(RoleRequiredMixin):
 
 def role_required(*roles):
     """Decorator to require specific roles for function views."""
+    # Resolved once when the view is decorated, not on every request
+    role_set = frozenset(roles)
+    
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
             if not request.user.is_authenticated:
                 return redirect('accounts:login')
             
-            if not any(getattr(request.user, f'is_{role}', False) for role in roles):
+            if request.user.role not in role_set:
                 messages.error(request, 'You do not have permission to access this page.')
                 return redirect('dashboard')
             
@@ -0,0 +1,43 @@
+"""Signal handlers for the core app."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from catalog.models import SKU
+from farmers.models import Farmer
+from orders.models import Order
+from pricing.models import FarmerPrice
+from ranking.models import FarmerScore
+from regions.models import Region
+
+from .api_views import invalidate_api_etag
+from .views import invalidate_dashboard_cache
+
+
+@receiver([post_save, post_delete], sender=Farmer)
+@receiver([post_save, post_delete], sender=FarmerPrice)
+@receiver([post_save, post_delete], sender=Order)
+@receiver([post_save, post_delete], sender=FarmerScore)
+def clear_dashboard_cache(sender, **kwargs):
+    """Drop cached dashboards when data they summarize changes."""
+    invalidate_dashboard_cache()
+
+
+@receiver([post_save, post_delete], sender=Farmer)
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=Region)
+def retire_farmers_api_etag(sender, update_fields=None, **kwargs):
+    """New farmers API ETags when a farmer, their name or region changes."""
+    # Logging in only stamps last_login, which the API doesn't show
+    if update_fields != frozenset({'last_login'}):
+        invalidate_api_etag('farmers')
+
+
+@receiver([post_save, post_delete], sender=FarmerPrice)
+@receiver([post_save, post_delete], sender=SKU)
+@receiver([post_save, post_delete], sender=User)
+def retire_prices_api_etag(sender, update_fields=None, **kwargs):
+    """New prices API ETags when a price, its SKU or its farmer's name changes."""
+    if update_fields != frozenset({'last_login'}):
+        invalidate_api_etag('prices')
@@ -1,11 +1,18 @@
 """Language template tags for internationalization."""
 
+from decimal import ROUND_HALF_UP, Decimal
+
 from django import template
 from django.conf import settings
 from django.utils import translation
 
 register = template.Library()
 
+_PAISE = Decimal('0.01')
+
+# Language code -> display name, built once from the (static) settings
+_LANGUAGE_NAMES = dict(settings.LANGUAGES)
+
 
 @register.simple_tag
 def get_current_language():
@@ -16,11 +23,7 @@ def get_current_language():
 @register.simple_tag
 def get_current_language_name():
     """Get the current active language name."""
-    current_lang = translation.get_language()
-    for code, name in settings.LANGUAGES:
-        if code == current_lang:
-            return name
-    return 'English'  # Default fallback
+    return _LANGUAGE_NAMES.get(translation.get_language(), 'English')  # Default fallback
 
 
 @register.simple_tag
@@ -34,6 +37,9 @@ def currency_format(value):
     """Format currency with ₹ symbol."""
     if value is None:
         return '₹ 0'
+    # Prices are Decimals: format them directly rather than via float
+    if isinstance(value, Decimal):
+        return f'₹ {value.quantize(_PAISE, ROUND_HALF_UP):,.2f}'
     try:
         return f'₹ {float(value):,.2f}'
     except (ValueError, TypeError):
@@ -1,3 +1,145 @@
-from django.test import TestCase
+import datetime
+from unittest import mock
 
-# Create your tests here.
+import orjson
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import RequestFactory, TestCase
+
+from accounts.models import User
+from catalog.models import SKU
+from farmers.models import Farmer
+from pricing.models import FarmerPrice
+from regions.models import Region
+
+from . import api_views, views
+
+
+class KeysetApiTests(TestCase):
+    """The list APIs page with an after_id (and after_date) cursor."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user('admin', 'admin@example.com', 'pw', role='admin')
+        region = Region.objects.create(name='Erode', code='ERD')
+        cls.farmers = [
+            Farmer.objects.create(
+                user=User.objects.create_user(f'farmer{i}', f'farmer{i}@example.com', 'pw'),
+                region=region, contact_number='9000000000', address='Farm',
+            )
+            for i in range(3)
+        ]
+        sku = SKU.objects.create(code='TOM', name='Tomato')
+        # Two prices share a date, so the id breaks the tie
+        cls.prices = [
+            FarmerPrice.objects.create(
+                farmer=farmer, sku=sku, region=region, date=date, price=20
+            )
+            for farmer, date in zip(cls.farmers, [
+                datetime.date(2026, 10, 2), datetime.date(2026, 10, 2), datetime.date(2026, 10, 1),
+            ])
+        ]
+
+    def get(self, view, headers=None, **params):
+        request = RequestFactory().get('/api/', params, headers=headers)
+        request.user = self.admin
+        return view(request)
+
+    def get_json(self, view, **params):
+        response = self.get(view, **params)
+        self.assertEqual(response.status_code, 200)
+        return orjson.loads(response.content)
+
+    def test_farmers_are_paged_by_id(self):
+        first = self.get_json(api_views.farmers_api, limit=2)
+        self.assertEqual([f['id'] for f in first['results']], [f.pk for f in self.farmers[:2]])
+        self.assertEqual(first['next_after_id'], self.farmers[1].pk)
+
+        last = self.get_json(api_views.farmers_api, limit=2, after_id=first['next_after_id'])
+        self.assertEqual([f['id'] for f in last['results']], [self.farmers[2].pk])
+        self.assertIsNone(last['next_after_id'])
+
+    def test_prices_are_paged_newest_first(self):
+        first = self.get_json(api_views.prices_api, limit=1)
+        newest = self.prices[1]
+        self.assertEqual([p['id'] for p in first['results']], [newest.pk])
+        self.assertEqual(
+            (first['next_after_date'], first['next_after_id']), ('2026-10-02', newest.pk)
+        )
+
+        rest = self.get_json(
+            api_views.prices_api,
+            after_date=first['next_after_date'], after_id=first['next_after_id'],
+        )
+        self.assertEqual([p['id'] for p in rest['results']], [self.prices[0].pk, self.prices[2].pk])
+        self.assertIsNone(rest['next_after_date'])
+        self.assertIsNone(rest['next_after_id'])
+
+    def test_malformed_cursors_are_rejected(self):
+        for view, params in [
+            (api_views.farmers_api, {'after_id': 'x'}),
+            (api_views.users_api, {'limit': 'all'}),
+            (api_views.prices_api, {'after_id': '3'}),
+            (api_views.prices_api, {'after_date': '2026-13-01', 'after_id': '3'}),
+        ]:
+            with self.subTest(view=view.__name__, **params):
+                response = self.get(view, **params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', orjson.loads(response.content))
+
+    def test_unchanged_pages_revalidate_without_queries(self):
+        etag = self.get(api_views.farmers_api, limit=2)['ETag']
+        with self.assertNumQueries(0):
+            response = self.get(api_views.farmers_api, {'if-none-match': etag}, limit=2)
+        self.assertEqual(response.status_code, 304)
+        self.assertNotEqual(self.get(api_views.farmers_api, limit=3)['ETag'], etag)
+
+    def test_etags_change_with_the_rows_behind_them(self):
+        farmers_etag = self.get(api_views.farmers_api)['ETag']
+        prices_etag = self.get(api_views.prices_api)['ETag']
+
+        self.farmers[0].user.last_login = self.farmers[0].user.date_joined
+        self.farmers[0].user.save(update_fields=['last_login'])
+        self.assertEqual(self.get(api_views.farmers_api)['ETag'], farmers_etag)
+
+        self.farmers[0].user.first_name = 'Kavin'
+        self.farmers[0].user.save()
+        self.assertNotEqual(self.get(api_views.farmers_api)['ETag'], farmers_etag)
+        self.assertNotEqual(self.get(api_views.prices_api)['ETag'], prices_etag)
+
+        prices_etag = self.get(api_views.prices_api)['ETag']
+        self.prices[2].delete()
+        self.assertNotEqual(self.get(api_views.prices_api)['ETag'], prices_etag)
+
+    def test_etags_expire_when_the_version_bump_is_not_seen(self):
+        now = 1_800_000_000.0
+        with mock.patch('time.time', return_value=now):
+            etag = self.get(api_views.prices_api)['ETag']
+            # Another process bumps its own cache, and update() sends no signals
+            with mock.patch.object(api_views, 'cache', LocMemCache('elsewhere', {})):
+                api_views.invalidate_api_etag('prices')
+            FarmerPrice.objects.update(price=25)
+            self.assertEqual(self.get(api_views.prices_api)['ETag'], etag)
+
+        with mock.patch('time.time', return_value=now + api_views.API_ETAG_TIMEOUT):
+            self.assertNotEqual(self.get(api_views.prices_api)['ETag'], etag)
+
+
+class SkuUploadTests(TestCase):
+    """Bulk SKU uploads report only the rows actually stored."""
+
+    def test_rows_lost_to_a_code_race_are_reported_as_errors(self):
+        bulk_create = SKU.objects.bulk_create
+
+        def racing_bulk_create(skus, **kwargs):
+            # A concurrent upload takes the first code between read and insert
+            SKU.objects.create(code=skus[0].code, name='Raced In')
+            return bulk_create(skus, **kwargs)
+
+        with mock.patch.object(type(SKU.objects), 'bulk_create', side_effect=racing_bulk_create):
+            result = views.process_sku_text('Tomato Country\nOnion Big')
+
+        self.assertEqual(result['created_count'], 1)
+        self.assertEqual([sku.name for sku in result['created_skus']], ['Onion Big'])
+        self.assertIsNotNone(result['created_skus'][0].pk)
+        self.assertEqual(len(result['errors']), 1)
+        self.assertIn('Tomato Country', result['errors'][0])
@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import include, path
 from . import views, api_views
 
 app_name = 'core'
@@ -11,10 +11,12 @@ urlpatterns = [
     path('bulk-upload-sku/', views.bulk_upload_sku, name='bulk_upload_sku'),
     path('download-sku-template/', views.download_sku_template, name='download_sku_template'),
     
-    # API endpoints
-    path('api/farmers/', api_views.farmers_api, name='farmers_api'),
-    path('api/prices/', api_views.prices_api, name='prices_api'),
-    path('api/orders/', api_views.orders_api, name='orders_api'),
-    path('api/users/', api_views.users_api, name='users_api'),
-    path('api/stats/', api_views.dashboard_stats_api, name='dashboard_stats_api'),
+    # API endpoints, grouped so non-API requests skip them on one prefix check
+    path('api/', include([
+        path('farmers/', api_views.farmers_api, name='farmers_api'),
+        path('prices/', api_views.prices_api, name='prices_api'),
+        path('orders/', api_views.orders_api, name='orders_api'),
+        path('users/', api_views.users_api, name='users_api'),
+        path('stats/', api_views.dashboard_stats_api, name='dashboard_stats_api'),
+    ])),
 ]
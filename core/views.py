@@ -7,20 +7,25 @@ from django.contrib.auth import views as auth_views
 from django.urls import reverse_lazy
 from django.utils.translation import gettext as _
 from django.contrib import messages
-from django.db.models import Count, Avg, Sum
+from django.core.cache import cache
+from django.db.models import Count, Avg, F, Prefetch, Q, Sum, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
-from datetime import timedelta
-from django.http import JsonResponse, HttpResponse
-from django.views.decorators.http import require_http_methods
+from datetime import datetime, timedelta
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import condition, require_http_methods
 import csv
+import hashlib
 import io
 import re
+import time
 
 from farmers.models import Farmer
 from pricing.models import FarmerPrice
 from orders.models import Order
 from ranking.models import FarmerScore
 from catalog.models import SKU
+from .api_views import get_dashboard_stats
 from .rbac import (
     admin_required, region_head_required, buyer_required, farmer_required
 )
@@ -34,52 +39,52 @@ def home(request):
         return redirect('accounts:login')
 
 
+def _dashboard_etag(request):
+    """Weak ETag for the dashboard page, or None to always render it."""
+    # Pending messages are consumed by rendering, so never answer 304 over them
+    if len(messages.get_messages(request)):
+        return None
+    # The page changes with the data version, the user and their language, and
+    # embeds a token derived from the CSRF secret. The time bucket retires the
+    # tag as the cached dashboard data and table counts expire.
+    version = cache.get_or_set(DASHBOARD_CACHE_VERSION_KEY, time.time_ns, None)
+    state = '|'.join(str(part) for part in (
+        request.user.pk, request.user.role, request.LANGUAGE_CODE,
+        request.META.get('CSRF_COOKIE', ''), version,
+        int(time.time() // DASHBOARD_CACHE_TIMEOUT),
+    ))
+    return f'W/"dash-{hashlib.md5(state.encode()).hexdigest()}"'
+
+
 @login_required
+@condition(etag_func=_dashboard_etag)
 def dashboard(request):
     """Role-based dashboard router"""
-    user = request.user
-    
     # Route to appropriate dashboard based on role
-    if user.is_admin:
-        return admin_dashboard(request)
-    elif user.is_region_head:
-        return region_head_dashboard(request)
-    elif user.is_buyer_head:
-        return buyer_head_dashboard(request)
-    elif user.is_buyer:
-        return buyer_dashboard(request)
-    elif user.is_farmer:
-        return farmer_dashboard(request)
-    else:
-        # Default dashboard for any other roles
-        context = {'title': _('Dashboard'), 'user': user}
-        return render(request, 'core/dashboard.html', context)
+    return DASHBOARD_VIEWS.get(request.user.role, _default_dashboard)(request)
 
 
 @admin_required
 def admin_dashboard(request):
     """Admin dashboard with full system overview"""
-    from accounts.models import User
-    from catalog.models import SKU
-    from regions.models import Region
-    
     context = {
         'title': _('Admin Dashboard'),
         'user': request.user,
         'dashboard_type': 'admin'
     }
     
-    # System-wide statistics
+    # System-wide statistics, shared with the stats API (one cached query)
+    stats = get_dashboard_stats()
     context.update({
-        'total_users': User.objects.count(),
-        'total_farmers': Farmer.objects.count(),
-        'total_regions': Region.objects.count(),
-        'total_skus': SKU.objects.count(),
-        'role_distribution': User.objects.values('role').annotate(count=Count('role')),
+        'total_users': stats['total_users'],
+        'total_farmers': stats['total_farmers'],
+        'total_regions': stats['regions'],
+        'total_skus': stats['total_skus'],
     })
     
-    # Get comprehensive dashboard data
-    context.update(_get_admin_dashboard_data(request.user))
+    # Get comprehensive dashboard data (cached, so a repeat load runs no
+    # dashboard queries at all)
+    context.update(_cached_dashboard_data('admin', request.user, _get_admin_dashboard_data))
     
     return render(request, 'core/dashboard_admin.html', context)
 
@@ -101,7 +106,7 @@ def region_head_dashboard(request):
         return render(request, 'core/dashboard_region_head.html', context)
     
     # Get region-specific data
-    context.update(_get_region_dashboard_data(request.user))
+    context.update(_cached_dashboard_data('region_head', request.user, _get_region_dashboard_data))
     
     return render(request, 'core/dashboard_region_head.html', context)
 
@@ -116,7 +121,7 @@ def buyer_head_dashboard(request):
     }
     
     # Get buyer head specific data
-    context.update(_get_buyer_head_dashboard_data(request.user))
+    context.update(_cached_dashboard_data('buyer_head', request.user, _get_buyer_head_dashboard_data))
     
     return render(request, 'core/dashboard_buyer_head.html', context)
 
@@ -131,7 +136,7 @@ def buyer_dashboard(request):
     }
     
     # Get buyer specific data
-    context.update(_get_buyer_dashboard_data(request.user))
+    context.update(_cached_dashboard_data('buyer', request.user, _get_buyer_dashboard_data))
     
     return render(request, 'core/dashboard_buyer.html', context)
 
@@ -146,40 +151,157 @@ def farmer_dashboard(request):
     }
     
     # Get farmer specific data
-    context.update(_get_farmer_dashboard_data(request.user))
+    context.update(_cached_dashboard_data('farmer', request.user, _get_farmer_dashboard_data))
     
     return render(request, 'core/dashboard_farmer.html', context)
 
 
+# Dashboard view for each role, resolved once rather than per request
+def _default_dashboard(request):
+    """Default dashboard for any other roles"""
+    context = {'title': _('Dashboard'), 'user': request.user}
+    return render(request, 'core/dashboard.html', context)
+
+
+DASHBOARD_VIEWS = {
+    'admin': admin_dashboard,
+    'region_head': region_head_dashboard,
+    'buyer_head': buyer_head_dashboard,
+    'buyer': buyer_dashboard,
+    'farmer': farmer_dashboard,
+}
+
+
+DASHBOARD_CACHE_TIMEOUT = 60  # seconds
+DASHBOARD_CACHE_VERSION_KEY = 'dash:version'
+
+
+def invalidate_dashboard_cache():
+    """Retire every cached dashboard by moving to a new cache key version."""
+    cache.set(DASHBOARD_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+def _cached_dashboard_data(role, user, compute):
+    """Cached result of compute(user), keyed per role and user."""
+    # A timestamp version can't repeat, even if the version key is evicted
+    version = cache.get_or_set(DASHBOARD_CACHE_VERSION_KEY, time.time_ns, None)
+    return cache.get_or_set(
+        f'dash:{role}:{user.pk}:{version}', lambda: compute(user), DASHBOARD_CACHE_TIMEOUT
+    )
+
+
+# Columns the dashboard price and order lists render; the rest stay deferred
+PRICE_ROW_FIELDS = ('price', 'date', 'sku__name', 'sku__unit')
+ORDER_ROW_FIELDS = ('quantity', 'total_amount', 'status', 'created_at', 'sku__name', 'sku__unit')
+USER_NAME_FIELDS = ('first_name', 'last_name', 'username')
+
+
+def _user_name_fields(path):
+    """Fields get_full_name()|default:username reads on the user at ``path``."""
+    return tuple(f'{path}__{field}' for field in USER_NAME_FIELDS)
+
+
+# Largest slice a dashboard list takes; each list is read in a single fetch
+DASHBOARD_ROW_CHUNK = 20
+
+
+def _rows(queryset):
+    """A sliced dashboard list, evaluated into a plain list for caching."""
+    # The iterator skips the QuerySet's result cache, and caching the list
+    # rather than the QuerySet keeps its query tree out of the pickled entry
+    return list(queryset.iterator(chunk_size=DASHBOARD_ROW_CHUNK))
+
+
+def _assigned_buyer_prefetch():
+    """Load the assigned buyers of an order list in one query, each buyer once."""
+    # A handful of buyers handle most orders, so fetching them separately
+    # is narrower than joining the same buyer columns onto every order row
+    from accounts.models import User
+    
+    return Prefetch('assigned_buyer', queryset=User.objects.only(*USER_NAME_FIELDS))
+
+
+def _latest_prices_per_sku_region(limit):
+    """Most recent price of up to ``limit`` SKU-region pairs, in one query."""
+    # ROW_NUMBER() over each pair picks its newest row without a query per
+    # pair; fp_sku_region_date_price_idx serves the partition ordering
+    return list(
+        FarmerPrice.objects.annotate(
+            recency=Window(
+                RowNumber(),
+                partition_by=[F('sku_id'), F('region_id')],
+                order_by=[F('date').desc(), F('id').desc()],
+            )
+        ).filter(recency=1).select_related('farmer__user', 'sku', 'region').only(
+            *PRICE_ROW_FIELDS, 'region__name', *_user_name_fields('farmer__user')
+        )[:limit]
+    )
+
+
+def _top_suppliers(limit):
+    """Farmers with the most orders, most first, each with an ``order_count``."""
+    # Rank on the orders table alone, then load just the winning farmers
+    order_counts = dict(
+        Order.objects.values_list('farmer_id').annotate(
+            order_count=Count('id')
+        ).order_by('-order_count', 'farmer_id')[:limit]
+    )
+    suppliers = Farmer.objects.select_related('user', 'region').only(
+        'region__name', *_user_name_fields('user')
+    ).in_bulk(order_counts)
+    
+    # A farmer deleted since the orders were counted is left out
+    top = []
+    for farmer_id, order_count in order_counts.items():
+        supplier = suppliers.get(farmer_id)
+        if supplier is not None:
+            supplier.order_count = order_count
+            top.append(supplier)
+    return top
+
+
+def _weekly_window():
+    """First day of the dashboards' one-week window, as a date and an aware datetime."""
+    week_ago = timezone.now().date() - timedelta(days=7)
+    # DateTimeFields compare against the aware midnight, not a naive date
+    return week_ago, timezone.make_aware(datetime.combine(week_ago, datetime.min.time()))
+
+
 def _get_admin_dashboard_data(user):
     """Get comprehensive dashboard data for admin users"""
-    today = timezone.now().date()
-    week_ago = today - timedelta(days=7)
-    month_ago = today - timedelta(days=30)
+    from accounts.models import User
+    
+    week_ago, week_start = _weekly_window()
     
     # Recent activity across all regions
     recent_prices = FarmerPrice.objects.select_related(
         'farmer__user', 'sku', 'region'
+    ).only(
+        *PRICE_ROW_FIELDS, 'region__name', *_user_name_fields('farmer__user')
     ).order_by('-created_at')[:10]
     
     recent_orders = Order.objects.select_related(
-        'farmer__user', 'assigned_buyer', 'sku'
+        'farmer__user', 'sku'
+    ).prefetch_related(_assigned_buyer_prefetch()).only(
+        *ORDER_ROW_FIELDS, *_user_name_fields('farmer__user'), 'assigned_buyer'
     ).order_by('-created_at')[:10]
     
     # System performance metrics
+    weekly_orders = Order.objects.filter(created_at__gte=week_start).aggregate(
+        placed=Count('id'),
+        revenue=Sum('total_amount', filter=Q(status='completed')),
+    )
     weekly_stats = {
-        'new_farmers': Farmer.objects.filter(created_at__gte=week_ago).count(),
+        'new_farmers': Farmer.objects.filter(created_at__gte=week_start).count(),
         'price_submissions': FarmerPrice.objects.filter(date__gte=week_ago).count(),
-        'orders_placed': Order.objects.filter(created_at__gte=week_ago).count(),
-        'revenue': Order.objects.filter(
-            created_at__gte=week_ago,
-            status='completed'
-        ).aggregate(total=Sum('total_amount'))['total'] or 0
+        'orders_placed': weekly_orders['placed'],
+        'revenue': weekly_orders['revenue'] or 0
     }
     
     return {
-        'recent_prices': recent_prices,
-        'recent_orders': recent_orders,
+        'role_distribution': User.role_distribution(),
+        'recent_prices': _rows(recent_prices),
+        'recent_orders': _rows(recent_orders),
         'weekly_stats': weekly_stats,
     }
 
@@ -187,95 +309,83 @@ def _get_admin_dashboard_data(user):
 def _get_region_dashboard_data(user):
     """Get dashboard data for region head users"""
     region = user.region
-    today = timezone.now().date()
-    week_ago = today - timedelta(days=7)
+    week_ago, week_start = _weekly_window()
     
     # Region-specific data
-    region_farmers = Farmer.objects.filter(region=region)
+    weekly_prices = FarmerPrice.objects.filter(region=region, date__gte=week_ago)
     
-    recent_prices = FarmerPrice.objects.filter(
-        region=region,
-        date__gte=week_ago
-    ).select_related('farmer__user', 'sku').order_by('-created_at')[:10]
+    recent_prices = weekly_prices.select_related(
+        'farmer__user', 'sku'
+    ).only(
+        *PRICE_ROW_FIELDS, *_user_name_fields('farmer__user')
+    ).order_by('-created_at')[:10]
     
     recent_orders = Order.objects.filter(
         farmer__region=region
-    ).select_related('farmer__user', 'assigned_buyer', 'sku').order_by('-created_at')[:5]
-    
-    # Region performance
+    ).select_related('farmer__user', 'sku').prefetch_related(_assigned_buyer_prefetch()).only(
+        *ORDER_ROW_FIELDS, *_user_name_fields('farmer__user'), 'assigned_buyer'
+    ).order_by('-created_at')[:5]
+    
+    # Region performance, over the whole week rather than the ten rows shown
+    weekly_price_stats = weekly_prices.aggregate(
+        active_farmers=Count('farmer', distinct=True),
+        avg_price=Avg('price'),
+    )
     region_stats = {
-        'total_farmers': region_farmers.count(),
-        'active_farmers': recent_prices.values('farmer').distinct().count(),
+        'total_farmers': Farmer.objects.filter(region=region).count(),
+        'active_farmers': weekly_price_stats['active_farmers'],
         'weekly_orders': Order.objects.filter(
             farmer__region=region,
-            created_at__gte=week_ago
+            created_at__gte=week_start
         ).count(),
-        'avg_price': recent_prices.aggregate(avg=Avg('price'))['avg'] or 0
+        'avg_price': weekly_price_stats['avg_price'] or 0
     }
     
     return {
-        'recent_prices': recent_prices,
-        'recent_orders': recent_orders,
+        'recent_prices': _rows(recent_prices),
+        'recent_orders': _rows(recent_orders),
         'region_stats': region_stats,
     }
 
 
 def _get_buyer_head_dashboard_data(user):
     """Get dashboard data for buyer head users"""
-    today = timezone.now().date()
-    week_ago = today - timedelta(days=7)
-    
-    # Latest prices across all regions (MySQL-compatible approach)
-    # Get latest price per SKU-region combination
-    latest_prices = []
-    sku_region_combinations = FarmerPrice.objects.values('sku', 'region').distinct()
-    
-    for combo in sku_region_combinations[:20]:
-        latest_price = FarmerPrice.objects.filter(
-            sku=combo['sku'], 
-            region=combo['region']
-        ).select_related('farmer__user', 'sku', 'region').order_by('-date').first()
-        if latest_price:
-            latest_prices.append(latest_price)
+    week_ago, week_start = _weekly_window()
+    
+    # Latest price per SKU-region combination
+    latest_prices = _latest_prices_per_sku_region(20)
     
     # All recent orders (buyer head can see all)
     recent_orders = Order.objects.select_related(
-        'farmer__user', 'assigned_buyer', 'sku'
+        'farmer__user', 'sku'
+    ).prefetch_related(_assigned_buyer_prefetch()).only(
+        *ORDER_ROW_FIELDS, *_user_name_fields('farmer__user'), 'assigned_buyer'
     ).order_by('-created_at')[:10]
     
-    # Procurement statistics
+    # Procurement statistics; both order counts come from one pass
+    order_counts = Order.objects.aggregate(
+        pending=Count('id', filter=Q(status='pending')),
+        weekly=Count('id', filter=Q(created_at__gte=week_start)),
+    )
     procurement_stats = {
-        'pending_orders': Order.objects.filter(status='pending').count(),
-        'weekly_orders': Order.objects.filter(created_at__gte=week_ago).count(),
-        'top_suppliers': Farmer.objects.annotate(
-            order_count=Count('orders')
-        ).order_by('-order_count')[:5]
+        'pending_orders': order_counts['pending'],
+        'weekly_orders': order_counts['weekly'],
+        'top_suppliers': _top_suppliers(5)
     }
     
     return {
         'latest_prices': latest_prices,
-        'recent_orders': recent_orders,
+        'recent_orders': _rows(recent_orders),
         'procurement_stats': procurement_stats,
     }
 
 
 def _get_buyer_dashboard_data(user):
     """Get dashboard data for regular buyer users"""
-    today = timezone.now().date()
-    week_ago = today - timedelta(days=7)
-    
-    # Latest prices (MySQL-compatible approach)
-    # Get latest price per SKU-region combination
-    latest_prices = []
-    sku_region_combinations = FarmerPrice.objects.values('sku', 'region').distinct()
-    
-    for combo in sku_region_combinations[:15]:
-        latest_price = FarmerPrice.objects.filter(
-            sku=combo['sku'], 
-            region=combo['region']
-        ).select_related('farmer__user', 'sku', 'region').order_by('-date').first()
-        if latest_price:
-            latest_prices.append(latest_price)
+    week_ago, week_start = _weekly_window()
+    
+    # Latest price per SKU-region combination
+    latest_prices = _latest_prices_per_sku_region(15)
     
     # Base QuerySet for orders created by this buyer
     my_orders_base = Order.objects.filter(
@@ -283,72 +393,71 @@ def _get_buyer_dashboard_data(user):
     ).select_related('farmer__user', 'sku')
     
     # Recent orders for display (sliced)
-    my_orders = my_orders_base.order_by('-created_at')[:10]
+    my_orders = my_orders_base.only(
+        *ORDER_ROW_FIELDS, *_user_name_fields('farmer__user')
+    ).order_by('-created_at')[:10]
     
-    # Buyer-specific stats (using base QuerySet)
+    # Buyer-specific stats in one query over the base QuerySet
+    order_totals = my_orders_base.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+        weekly=Count('id', filter=Q(created_at__gte=week_start)),
+        spent=Sum('total_amount', filter=Q(status='completed')),
+    )
     buyer_stats = {
-        'my_orders': my_orders_base.count(),
-        'pending_orders': my_orders_base.filter(status='pending').count(),
-        'weekly_orders': my_orders_base.filter(created_at__gte=week_ago).count(),
-        'total_spent': my_orders_base.filter(
-            status='completed'
-        ).aggregate(total=Sum('total_amount'))['total'] or 0
+        'my_orders': order_totals['total'],
+        'pending_orders': order_totals['pending'],
+        'weekly_orders': order_totals['weekly'],
+        'total_spent': order_totals['spent'] or 0
     }
     
     return {
         'latest_prices': latest_prices,
-        'my_orders': my_orders,
+        'my_orders': _rows(my_orders),
         'buyer_stats': buyer_stats,
     }
 
 
 def _get_farmer_dashboard_data(user):
     """Get dashboard data for farmer users"""
-    try:
-        farmer = user.farmer_profile
-    except:
+    # Loaded with the session user (see EmailBackend.get_user)
+    farmer = getattr(user, 'farmer_profile', None)
+    if farmer is None:
         return {'error': _('Farmer profile not found')}
     
-    today = timezone.now().date()
-    week_ago = today - timedelta(days=7)
+    week_ago, week_start = _weekly_window()
     
     # Recent prices submitted
     recent_prices = FarmerPrice.objects.filter(
         farmer=farmer,
         date__gte=week_ago
-    ).select_related('sku').order_by('-date')[:5]
+    ).select_related('sku', 'region').only(
+        *PRICE_ROW_FIELDS, 'region__name'
+    ).order_by('-date')[:5]
     
     # Recent orders
     recent_orders = Order.objects.filter(
         farmer=farmer
-    ).select_related('assigned_buyer').order_by('-created_at')[:5]
+    ).select_related('sku').prefetch_related(_assigned_buyer_prefetch()).only(
+        *ORDER_ROW_FIELDS, 'assigned_buyer'
+    ).order_by('-created_at')[:5]
     
     # Performance stats
-    total_orders = Order.objects.filter(farmer=farmer).count()
-    # Calculate average score from ranking data instead of non-existent quality_rating
-    avg_rating = FarmerScore.objects.filter(farmer=farmer).aggregate(
-        avg_score=Avg('total_score')
-    )['avg_score'] or 0
-    
-    # Current ranking
-    try:
-        farmer_score = FarmerScore.objects.get(farmer=farmer, is_current=True)
-        # Calculate rank by counting how many farmers have higher scores
-        current_rank = FarmerScore.objects.filter(
-            is_current=True,
-            total_score__gt=farmer_score.total_score
-        ).count() + 1
-        total_score = farmer_score.total_score
-    except FarmerScore.DoesNotExist:
-        current_rank = None
-        total_score = 0
+    # Average score from ranking data (instead of non-existent quality_rating),
+    # stored on the farmer; the current score and its rank come from one row
+    current_score = FarmerScore.objects.filter(farmer=farmer, is_current=True).values(
+        'total_score', 'overall_rank'
+    ).first()
+    avg_rating = farmer.avg_score or 0
+    current_rank = current_score and current_score['overall_rank']
+    total_score = current_score['total_score'] if current_score else 0
     
     return {
         'farmer': farmer,
-        'recent_prices': recent_prices,
-        'recent_orders': recent_orders,
+        'recent_prices': _rows(recent_prices),
+        'recent_orders': _rows(recent_orders),
         'stats': {
-            'total_orders': total_orders,
+            'total_orders': farmer.total_orders,
             'avg_rating': round(avg_rating, 1),
             'current_rank': current_rank,
             'total_score': round(total_score, 1),
@@ -420,45 +529,41 @@ def bulk_upload_sku(request):
 def process_sku_text(sku_text):
     """Process SKU names from text input"""
     lines = [line.strip() for line in sku_text.split('\n') if line.strip()]
-    created_count = 0
     skipped_count = 0
     errors = []
-    created_skus = []
+    new_skus = []
     
+    # Codes are resolved against one read of the existing codes, then all
+    # new SKUs are inserted together
+    taken_codes = set(SKU.objects.values_list('code', flat=True))
     for line in lines:
         try:
             # Generate SKU code from name
-            sku_code = generate_sku_code(line)
+            sku_code = generate_sku_code(line, taken_codes)
             
             # Check if SKU already exists
-            if SKU.objects.filter(code=sku_code).exists():
+            if sku_code in taken_codes:
                 skipped_count += 1
                 continue
-                
+            
             # Determine category based on name
             category = determine_category(line)
             
-            # Create SKU
-            sku = SKU.objects.create(
+            sku = SKU(
                 code=sku_code,
                 name=line,
                 category=category,
                 unit='kg',  # Default unit
                 is_active=True
             )
-            created_skus.append(sku)
-            created_count += 1
+            _check_sku_row(sku)
+            taken_codes.add(sku_code)
+            new_skus.append(sku)
             
         except Exception as e:
             errors.append(f"Error creating '{line}': {str(e)}")
     
-    return {
-        'upload_success': True,
-        'created_count': created_count,
-        'skipped_count': skipped_count,
-        'errors': errors,
-        'created_skus': created_skus
-    }
+    return _bulk_create_skus(new_skus, skipped_count, errors)
 
 
 def process_sku_csv(csv_file):
@@ -468,10 +573,10 @@ def process_sku_csv(csv_file):
         decoded_file = csv_file.read().decode('utf-8')
         csv_data = csv.DictReader(io.StringIO(decoded_file))
         
-        created_count = 0
         skipped_count = 0
         errors = []
-        created_skus = []
+        new_skus = []
+        taken_codes = set(SKU.objects.values_list('code', flat=True))
         
         for row in csv_data:
             try:
@@ -479,17 +584,17 @@ def process_sku_csv(csv_file):
                 if not name:
                     continue
                 
-                sku_code = row.get('code', generate_sku_code(name))
-                category = row.get('category', determine_category(name))
+                # Only generate what the file doesn't provide
+                sku_code = row['code'] if 'code' in row else generate_sku_code(name, taken_codes)
+                category = row['category'] if 'category' in row else determine_category(name)
                 unit = row.get('unit', 'kg')
                 
                 # Check if SKU already exists
-                if SKU.objects.filter(code=sku_code).exists():
+                if sku_code in taken_codes:
                     skipped_count += 1
                     continue
                 
-                # Create SKU
-                sku = SKU.objects.create(
+                sku = SKU(
                     code=sku_code,
                     name=name,
                     category=category,
@@ -497,19 +602,14 @@ def process_sku_csv(csv_file):
                     description=row.get('description', ''),
                     is_active=True
                 )
-                created_skus.append(sku)
-                created_count += 1
+                _check_sku_row(sku)
+                taken_codes.add(sku_code)
+                new_skus.append(sku)
                 
             except Exception as e:
                 errors.append(f"Error processing row: {str(e)}")
         
-        return {
-            'upload_success': True,
-            'created_count': created_count,
-            'skipped_count': skipped_count,
-            'errors': errors,
-            'created_skus': created_skus
-        }
+        return _bulk_create_skus(new_skus, skipped_count, errors)
         
     except Exception as e:
         return {
@@ -518,6 +618,45 @@ def process_sku_csv(csv_file):
         }
 
 
+def _check_sku_row(sku):
+    """Raise ValueError for a value too long for its column."""
+    # The database would reject it, but only after failing the whole bulk
+    # insert, so each row is checked while it can still be reported alone
+    for field in sku._meta.concrete_fields:
+        value = getattr(sku, field.attname)
+        if field.max_length and isinstance(value, str) and len(value) > field.max_length:
+            raise ValueError(f"{field.verbose_name} is longer than {field.max_length} characters")
+
+
+def _bulk_create_skus(new_skus, skipped_count, errors):
+    """Insert the uploaded SKUs in one batch and build the upload result."""
+    created_skus = []
+    try:
+        SKU.objects.bulk_create(new_skus, ignore_conflicts=True, batch_size=500)
+        # Conflicting rows (a code taken by a concurrent upload, or on MySQL
+        # any row INSERT IGNORE rejects) are silently skipped, so report
+        # only the rows that are now stored
+        stored = {
+            (sku.code, sku.name): sku
+            for sku in SKU.objects.filter(code__in=[sku.code for sku in new_skus])
+        }
+        for sku in new_skus:
+            if (sku.code, sku.name) in stored:
+                created_skus.append(stored[sku.code, sku.name])
+            else:
+                errors.append(f"Error creating '{sku.name}': code {sku.code} was not stored")
+    except Exception as e:
+        errors.append(f"Error creating SKUs: {str(e)}")
+    
+    return {
+        'upload_success': True,
+        'created_count': len(created_skus),
+        'skipped_count': skipped_count,
+        'errors': errors,
+        'created_skus': created_skus
+    }
+
+
 def upload_predefined_skus():
     """Upload the predefined list of SKUs"""
     predefined_skus = [
@@ -574,10 +713,14 @@ def upload_predefined_skus():
     return process_sku_text('\n'.join(predefined_skus))
 
 
-def generate_sku_code(name):
-    """Generate SKU code from product name"""
+# Characters generate_sku_code strips from a name before building the code
+_NON_CODE_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+
+def generate_sku_code(name, taken_codes=None):
+    """Generate SKU code from product name, unique among ``taken_codes`` if given"""
     # Remove special characters and convert to uppercase
-    clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', name)
+    clean_name = _NON_CODE_CHARS_RE.sub('', name)
     words = clean_name.split()
     
     if len(words) == 1:
@@ -599,7 +742,13 @@ def generate_sku_code(name):
     counter = 1
     final_code = base_code
     
-    while SKU.objects.filter(code=final_code).exists():
+    if taken_codes is None:
+        # Every candidate starts with base_code, so one read covers them all
+        taken_codes = set(
+            SKU.objects.filter(code__startswith=base_code).values_list('code', flat=True)
+        )
+    
+    while final_code in taken_codes:
         final_code = f"{base_code}{counter:02d}"
         counter += 1
         if len(final_code) > 20:  # Prevent infinite loop
@@ -608,53 +757,69 @@ def generate_sku_code(name):
     return final_code
 
 
+# Category keywords for determine_category, matched anywhere in the
+# lowercased name (so 'grape' also matches 'Grapes')
+FRUIT_KEYWORDS = [
+    'apple', 'mango', 'banana', 'orange', 'lemon', 'grape', 'strawberry',
+    'pineapple', 'papaya', 'guava', 'pomegranate', 'kiwi', 'dragon fruit',
+    'watermelon', 'melon', 'pear', 'plum', 'avocado', 'coconut', 'fig',
+    'litchi', 'rambutan', 'mangosteen', 'custard apple', 'gooseberry',
+    'amla', 'jujube', 'tamarind', 'passion fruit'
+]
+SPICE_KEYWORDS = [
+    'ginger', 'garlic', 'chilli', 'coriander', 'mint', 'basil', 'rosemary',
+    'curry leaves'
+]
+
+# One alternation per category scans a name once instead of once per keyword
+_FRUIT_RE = re.compile('|'.join(map(re.escape, FRUIT_KEYWORDS)))
+_SPICE_RE = re.compile('|'.join(map(re.escape, SPICE_KEYWORDS)))
+_OTHER_RE = re.compile('egg|mushroom')
+
+
 def determine_category(name):
     """Determine product category based on name"""
     name_lower = name.lower()
     
-    # Fruit keywords
-    fruit_keywords = [
-        'apple', 'mango', 'banana', 'orange', 'lemon', 'grape', 'strawberry',
-        'pineapple', 'papaya', 'guava', 'pomegranate', 'kiwi', 'dragon fruit',
-        'watermelon', 'melon', 'pear', 'plum', 'avocado', 'coconut', 'fig',
-        'litchi', 'rambutan', 'mangosteen', 'custard apple', 'gooseberry',
-        'amla', 'jujube', 'tamarind', 'passion fruit'
-    ]
-    
-    # Spice/herb keywords
-    spice_keywords = [
-        'ginger', 'garlic', 'chilli', 'coriander', 'mint', 'basil', 'rosemary',
-        'curry leaves'
-    ]
-    
     # Check for fruits
-    for keyword in fruit_keywords:
-        if keyword in name_lower:
-            return 'fruit'
+    if _FRUIT_RE.search(name_lower):
+        return 'fruit'
     
     # Check for spices
-    for keyword in spice_keywords:
-        if keyword in name_lower:
-            return 'spice'
+    if _SPICE_RE.search(name_lower):
+        return 'spice'
     
     # Check for specific vegetable patterns
-    if any(word in name_lower for word in ['egg', 'mushroom']):
+    if _OTHER_RE.search(name_lower):
         return 'other'
     
     # Default to vegetable
     return 'vegetable'
 
 
+class _Echo:
+    """File-like object whose write() returns the value, for streaming CSV."""
+    
+    def write(self, value):
+        return value
+
+
+def _stream_csv(rows, filename):
+    """Stream ``rows`` as a CSV attachment, formatting one row at a time."""
+    writer = csv.writer(_Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in rows), content_type='text/csv'
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 @admin_required  
 @require_http_methods(["GET"])
 def download_sku_template(request):
     """Download CSV template for SKU bulk upload"""
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="sku_template.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow(['name', 'code', 'category', 'unit', 'description'])
-    writer.writerow(['Apple Red Delicious', 'APPLE01', 'fruit', 'kg', 'Fresh red delicious apples'])
-    writer.writerow(['Tomato Country', 'TOMATO01', 'vegetable', 'kg', 'Local variety tomatoes'])
-    
-    return response
+    return _stream_csv([
+        ['name', 'code', 'category', 'unit', 'description'],
+        ['Apple Red Delicious', 'APPLE01', 'fruit', 'kg', 'Fresh red delicious apples'],
+        ['Tomato Country', 'TOMATO01', 'vegetable', 'kg', 'Local variety tomatoes'],
+    ], 'sku_template.csv')
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:10
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_existing_orders(apps, schema_editor):
+    Farmer = apps.get_model("farmers", "Farmer")
+    Order = apps.get_model("orders", "Order")
+    order_count = (
+        Order.objects.filter(farmer=OuterRef("pk"))
+        .order_by()
+        .values("farmer")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    Farmer.objects.update(total_orders=Coalesce(Subquery(order_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("farmers", "0002_remove_farmer_id"),
+        ("orders", "0002_order_created_at_desc_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="farmer",
+            name="total_orders",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Total Orders"
+            ),
+        ),
+        migrations.RunPython(count_existing_orders, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:13
+
+from django.db import migrations, models
+from django.db.models import Avg, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def average_existing_scores(apps, schema_editor):
+    Farmer = apps.get_model("farmers", "Farmer")
+    FarmerScore = apps.get_model("ranking", "FarmerScore")
+    average = (
+        FarmerScore.objects.filter(farmer=OuterRef("pk"))
+        .order_by()
+        .values("farmer")
+        .annotate(average=Avg("total_score"))
+        .values("average")
+    )
+    Farmer.objects.update(
+        avg_score=Coalesce(Subquery(average), 0, output_field=models.DecimalField())
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("farmers", "0003_farmer_total_orders"),
+        ("ranking", "0002_farmerscore_overall_rank"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="farmer",
+            name="avg_score",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                editable=False,
+                max_digits=5,
+                verbose_name="Average Score",
+            ),
+        ),
+        migrations.RunPython(average_existing_scores, migrations.RunPython.noop),
+    ]
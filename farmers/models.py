@@ -1,6 +1,8 @@
 """Farmer models for Kannammal Agro."""
 
 from django.db import models
+from django.db.models import Avg, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from core.models import BaseModel
@@ -77,6 +79,21 @@ class Farmer(BaseModel):
         related_name='verified_farmers',
         verbose_name=_('Verified By')
     )
+    # Kept in step with the orders table by orders.signals, so dashboards
+    # read a column instead of counting the farmer's orders
+    total_orders = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_('Total Orders')
+    )
+    # Mean of all the farmer's ranking scores, kept current by ranking.signals
+    avg_score = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        verbose_name=_('Average Score')
+    )
     
     class Meta:
         verbose_name = _('Farmer')
@@ -86,6 +103,29 @@ class Farmer(BaseModel):
     def __str__(self):
         return f"F{self.id:04d} - {self.user.get_full_name() or self.user.username}"
     
+    @classmethod
+    def recount_total_orders(cls):
+        """Recompute every farmer's total_orders, e.g. after bulk-inserted orders."""
+        from orders.models import Order
+        
+        order_count = Order.objects.filter(farmer=OuterRef('pk')).order_by().values(
+            'farmer'
+        ).annotate(count=Count('id')).values('count')
+        cls.objects.update(total_orders=Coalesce(Subquery(order_count), 0))
+    
+    @classmethod
+    def refresh_avg_score(cls, farmer_ids=None):
+        """Recompute avg_score for the given farmers (default: all of them)."""
+        from ranking.models import FarmerScore
+        
+        average = FarmerScore.objects.filter(farmer=OuterRef('pk')).order_by().values(
+            'farmer'
+        ).annotate(average=Avg('total_score')).values('average')
+        farmers = cls.objects.all() if farmer_ids is None else cls.objects.filter(pk__in=farmer_ids)
+        farmers.update(
+            avg_score=Coalesce(Subquery(average), 0, output_field=models.DecimalField())
+        )
+    
     @property
     def is_verified(self):
         """Check if farmer is verified."""
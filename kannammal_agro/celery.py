@@ -0,0 +1,15 @@
+"""
+Celery application for kannammal_agro.
+
+Task settings are read from the CELERY_* entries in Django settings.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "kannammal_agro.settings")
+
+app = Celery("kannammal_agro")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
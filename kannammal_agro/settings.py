@@ -214,6 +214,23 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'refresh-role-distribution': {
+        'task': 'accounts.tasks.refresh_role_distribution',
+        'schedule': 15 * 60,  # accounts.models.ROLE_DISTRIBUTION_REFRESH
+    },
+}
+
+# Cache Configuration (e.g. CACHE_URL=rediscache://localhost:6379/1)
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+# refresh_role_distribution fills the cache the web processes read, so it
+# needs a shared CACHE_URL; with the per-process local-memory default it
+# would only fill the Celery worker's own copy
+if CACHES['default']['BACKEND'] == 'django.core.cache.backends.locmem.LocMemCache':
+    del CELERY_BEAT_SCHEDULE['refresh-role-distribution']
 
 # Email Configuration
 EMAIL_BACKEND = env('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
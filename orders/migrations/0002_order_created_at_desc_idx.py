@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["-created_at"], name="order_created_at_desc_idx"
+            ),
+        ),
+    ]
@@ -125,11 +125,23 @@ class Order(BaseModel):
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['farmer', 'status']),
             models.Index(fields=['region', 'status']),
+            # Recent-orders lists and weekly created_at windows
+            models.Index(fields=['-created_at'], name='order_created_at_desc_idx'),
         ]
         
     def __str__(self):
         return f"{self.order_number} - {self.farmer} - {self.sku.name}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the farmer the loaded order is counted against."""
+        instance = super().from_db(db, field_names, values)
+        if 'farmer_id' in field_names:
+            # orders.signals moves the order between farmers' total_orders
+            # when it's saved with a different farmer
+            instance._counted_farmer_id = instance.farmer_id
+        return instance
+    
     def save(self, *args, **kwargs):
         """Auto-calculate total amount and generate order number."""
         if not self.order_number:
@@ -0,0 +1,39 @@
+"""Signal handlers for the orders app."""
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from farmers.models import Farmer
+
+from .models import Order
+
+
+def _add_to_total_orders(farmer_id, delta):
+    farmers = Farmer.objects.filter(pk=farmer_id)
+    if delta < 0:
+        farmers = farmers.filter(total_orders__gt=0)
+    farmers.update(total_orders=F('total_orders') + delta)
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, update_fields=None, **kwargs):
+    """Count a new order, or move a reassigned one to its new farmer."""
+    if update_fields is not None and not {'farmer', 'farmer_id'} & update_fields:
+        return
+    if created:
+        _add_to_total_orders(instance.farmer_id, 1)
+    else:
+        # Orders not loaded from the database carry no original farmer;
+        # those are taken to be unchanged
+        counted_farmer_id = getattr(instance, '_counted_farmer_id', instance.farmer_id)
+        if counted_farmer_id != instance.farmer_id:
+            _add_to_total_orders(counted_farmer_id, -1)
+            _add_to_total_orders(instance.farmer_id, 1)
+    instance._counted_farmer_id = instance.farmer_id
+
+
+@receiver(post_delete, sender=Order)
+def uncount_deleted_order(sender, instance, **kwargs):
+    """Take a deleted order off the farmer it was counted against."""
+    _add_to_total_orders(getattr(instance, '_counted_farmer_id', instance.farmer_id), -1)
@@ -1,3 +1,74 @@
 from django.test import TestCase
 
-# Create your tests here.
+from accounts.models import User
+from catalog.models import SKU
+from farmers.models import Farmer
+from regions.models import Region
+
+from .models import Order
+
+
+class FarmerTotalOrdersTests(TestCase):
+    """Farmer.total_orders follows the farmer's orders as they change."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Region.objects.create(name='Erode', code='ERD')
+        cls.buyer = User.objects.create_user('buyer', 'buyer@example.com', 'pw', role='buyer')
+        cls.sku = SKU.objects.create(code='TOM', name='Tomato')
+        cls.farmer = cls.make_farmer('kavin')
+
+    @classmethod
+    def make_farmer(cls, username):
+        return Farmer.objects.create(
+            user=User.objects.create_user(username, f'{username}@example.com', 'pw'),
+            region=cls.region, contact_number='9000000000', address='Farm',
+        )
+
+    def place_order(self, number, farmer=None):
+        return Order.objects.create(
+            order_number=f'ORD{number}', sku=self.sku, farmer=farmer or self.farmer,
+            region=self.region, quantity=10, unit_price=20, ordered_by=self.buyer,
+        )
+
+    def total_orders(self, farmer=None):
+        farmer = farmer or self.farmer
+        farmer.refresh_from_db(fields=['total_orders'])
+        return farmer.total_orders
+
+    def test_orders_are_counted_on_create_and_delete(self):
+        first, second = self.place_order(1), self.place_order(2)
+        self.assertEqual(self.total_orders(), 2)
+
+        second.status = 'confirmed'
+        second.save()
+        self.assertEqual(self.total_orders(), 2)
+
+        first.delete()
+        self.assertEqual(self.total_orders(), 1)
+
+    def test_reassigned_orders_move_between_farmers(self):
+        other = self.make_farmer('malar')
+        self.place_order(1)
+        order = Order.objects.get()
+
+        order.farmer = other
+        order.save(update_fields=['status'])
+        self.assertEqual((self.total_orders(), self.total_orders(other)), (1, 0))
+
+        order.save()
+        self.assertEqual((self.total_orders(), self.total_orders(other)), (0, 1))
+
+        order.farmer = self.farmer
+        order.save(update_fields=['farmer'])
+        self.assertEqual((self.total_orders(), self.total_orders(other)), (1, 0))
+
+        order.farmer = other
+        order.delete()
+        self.assertEqual((self.total_orders(), self.total_orders(other)), (0, 0))
+
+    def test_recount_repairs_drift(self):
+        self.place_order(1)
+        Farmer.objects.filter(pk=self.farmer.pk).update(total_orders=7)
+        Farmer.recount_total_orders()
+        self.assertEqual(self.total_orders(), 1)
@@ -54,7 +54,7 @@ class PriceSubmissionForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         
         # Only show active SKUs
-        self.fields['sku'].queryset = SKU.objects.filter(is_active=True).order_by('name')
+        self.fields['sku'].queryset = SKU.objects.listing().filter(is_active=True).order_by('name')
         
         # Add help text
         self.fields['price'].help_text = _('Price in local currency per unit')
@@ -98,7 +98,7 @@ class PriceFilterForm(forms.Form):
     """Form for filtering price comparisons"""
     
     sku = forms.ModelChoiceField(
-        queryset=SKU.objects.filter(is_active=True),
+        queryset=SKU.objects.listing().filter(is_active=True),
         required=False,
         label=_('Product'),
         widget=forms.Select(attrs={'class': 'form-select'})
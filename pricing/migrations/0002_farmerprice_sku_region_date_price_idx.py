@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pricing", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="farmerprice",
+            name="pricing_far_sku_id_b1a3b9_idx",
+        ),
+        migrations.AddIndex(
+            model_name="farmerprice",
+            index=models.Index(
+                fields=["sku", "region", "-date", "price"],
+                name="fp_sku_region_date_price_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pricing", "0002_farmerprice_sku_region_date_price_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="farmerprice",
+            index=models.Index(fields=["region", "-date"], name="fp_region_date_idx"),
+        ),
+    ]
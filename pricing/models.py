@@ -80,7 +80,15 @@ class FarmerPrice(BaseModel):
         unique_together = ['farmer', 'sku', 'date']
         ordering = ['-date', 'sku__name', 'price']
         indexes = [
-            models.Index(fields=['sku', 'region', 'date']),
+            models.Index(fields=['date', 'sku', 'region']),
+            models.Index(fields=['farmer', 'date']),
+            # Matches SKU.get_latest_price_by_region's filter and ordering
+            models.Index(
+                fields=['sku', 'region', '-date', 'price'],
+                name='fp_sku_region_date_price_idx',
+            ),
+            # Region head dashboard: a region's prices, newest first
+            models.Index(fields=['region', '-date'], name='fp_region_date_idx'),
         ]
         
     def __str__(self):
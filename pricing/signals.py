@@ -0,0 +1,16 @@
+"""Signal handlers for the pricing app."""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from catalog.models import SKU
+
+from .models import FarmerPrice
+
+
+@receiver(post_save, sender=FarmerPrice)
+@receiver(post_delete, sender=FarmerPrice)
+def clear_sku_price_cache(sender, instance, **kwargs):
+    """Drop the cached recent prices of the SKU a price belongs to."""
+    cache.delete(SKU.latest_prices_cache_key(instance.sku_id))
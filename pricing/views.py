@@ -117,7 +117,7 @@ def price_comparison(request):
     prices_qs = prices_qs.order_by('sku__name', 'price', '-submitted_at')
     
     # Get available SKUs for dropdown
-    available_skus = SKU.objects.filter(is_active=True).order_by('name')
+    available_skus = SKU.objects.listing().filter(is_active=True).order_by('name')
     
     # Get regions for admin users
     regions = None
@@ -260,7 +260,7 @@ def my_price_history(request):
     prices_qs = prices_qs.order_by('-date', 'sku__name')
     
     # Get available SKUs for farmer
-    farmer_skus = SKU.objects.filter(
+    farmer_skus = SKU.objects.listing().filter(
         farmerprices__farmer=farmer
     ).distinct().order_by('name')
     
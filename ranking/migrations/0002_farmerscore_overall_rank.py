@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:12
+
+from django.db import migrations, models
+
+
+def rank_current_scores(apps, schema_editor):
+    FarmerScore = apps.get_model("ranking", "FarmerScore")
+    updates = []
+    rank, previous_score = 0, None
+    scores = (
+        FarmerScore.objects.filter(is_current=True)
+        .order_by("-total_score")
+        .values_list("id", "total_score")
+    )
+    for position, (score_id, total_score) in enumerate(scores, 1):
+        if total_score != previous_score:
+            rank, previous_score = position, total_score
+        updates.append(FarmerScore(id=score_id, overall_rank=rank))
+    FarmerScore.objects.bulk_update(updates, ["overall_rank"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ranking", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="farmerscore",
+            name="overall_rank",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Overall Rank"
+            ),
+        ),
+        migrations.RunPython(rank_current_scores, migrations.RunPython.noop),
+    ]
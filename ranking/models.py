@@ -101,6 +101,14 @@ class FarmerScore(BaseModel):
         default=True,
         verbose_name=_('Is Current Score')
     )
+    # Position among all current scores (ties share a rank), stored by
+    # rank_current_scores() after each scoring run
+    overall_rank = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_('Overall Rank')
+    )
     
     class Meta:
         verbose_name = _('Farmer Score')
@@ -115,6 +123,22 @@ class FarmerScore(BaseModel):
     def __str__(self):
         return f"{self.farmer.farmer_id} - Score: {self.total_score} ({self.window_start} to {self.window_end})"
     
+    @classmethod
+    def rank_current_scores(cls):
+        """Store each current score's overall_rank and clear it on the rest."""
+        updates = []
+        rank, previous_score = 0, None
+        scores = cls.objects.filter(is_current=True).order_by('-total_score').values_list(
+            'id', 'total_score'
+        )
+        for position, (score_id, total_score) in enumerate(scores, 1):
+            # Equal scores share the rank of the first of them (1, 2, 2, 4)
+            if total_score != previous_score:
+                rank, previous_score = position, total_score
+            updates.append(cls(id=score_id, overall_rank=rank))
+        cls.objects.bulk_update(updates, ['overall_rank'], batch_size=500)
+        cls.objects.filter(is_current=False, overall_rank__isnull=False).update(overall_rank=None)
+    
     @property
     def rank_in_region(self):
         """Get farmer's rank in their region."""
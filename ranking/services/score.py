@@ -52,10 +52,9 @@ class FarmerRankingService:
         Higher score for more competitive (lower) prices.
         """
         # Get farmer's prices in the window
-        farmer_prices = FarmerPrice.objects.filter(
+        farmer_prices = FarmerPrice.alive.filter(
             farmer=farmer,
             date__range=[window_start, window_end],
-            deleted_at__isnull=True,
             is_active=True
         ).values('sku', 'region').annotate(
             avg_price=Avg('price')
@@ -69,11 +68,10 @@ class FarmerRankingService:
         
         for fp in farmer_prices:
             # Get median price for same SKU and region in the window
-            median_price = FarmerPrice.objects.filter(
+            median_price = FarmerPrice.alive.filter(
                 sku_id=fp['sku'],
                 region_id=fp['region'],
                 date__range=[window_start, window_end],
-                deleted_at__isnull=True,
                 is_active=True
             ).aggregate(
                 median=models.functions.Percentile('price', 0.5)
@@ -109,10 +107,9 @@ class FarmerRankingService:
         cutoff_hour = getattr(settings, 'PRICE_CUTOFF_HOUR', 9)
         
         # Count total submissions and on-time submissions
-        submissions = FarmerPrice.objects.filter(
+        submissions = FarmerPrice.alive.filter(
             farmer=farmer,
-            date__range=[window_start, window_end],
-            deleted_at__isnull=True
+            date__range=[window_start, window_end]
         ).values('date').annotate(
             on_time=Count('id', filter=Q(submitted_at__hour__lt=cutoff_hour))
         )
@@ -134,12 +131,11 @@ class FarmerRankingService:
         # Use last 90 days for delivery reliability
         cutoff_date = window_end - timedelta(days=90)
         
-        orders = Order.objects.filter(
+        orders = Order.alive.filter(
             farmer=farmer,
             created_at__date__gte=cutoff_date,
             created_at__date__lte=window_end,
-            status='delivered',
-            deleted_at__isnull=True
+            status='delivered'
         )
         
         total_orders = orders.count()
@@ -161,12 +157,11 @@ class FarmerRankingService:
         # Use last 90 days for fill rate
         cutoff_date = window_end - timedelta(days=90)
         
-        orders = Order.objects.filter(
+        orders = Order.alive.filter(
             farmer=farmer,
             created_at__date__gte=cutoff_date,
             created_at__date__lte=window_end,
             status='delivered',
-            deleted_at__isnull=True,
             delivered_quantity__isnull=False
         ).aggregate(
             total_ordered=Sum('quantity'),
@@ -186,10 +181,9 @@ class FarmerRankingService:
         """Compute total weighted score for a farmer."""
         
         # Check if farmer has minimum required submissions
-        submission_count = FarmerPrice.objects.filter(
+        submission_count = FarmerPrice.alive.filter(
             farmer=farmer,
-            date__range=[window_start, window_end],
-            deleted_at__isnull=True
+            date__range=[window_start, window_end]
         ).count()
         
         if submission_count < self.config.min_submissions_required:
@@ -234,10 +228,9 @@ class FarmerRankingService:
         """Compute supporting metrics for the score calculation."""
         
         # Price submission metrics
-        price_metrics = FarmerPrice.objects.filter(
+        price_metrics = FarmerPrice.alive.filter(
             farmer=farmer,
-            date__range=[window_start, window_end],
-            deleted_at__isnull=True
+            date__range=[window_start, window_end]
         ).aggregate(
             total_submissions=Count('id'),
             on_time_submissions=Count('id', filter=Q(
@@ -247,11 +240,10 @@ class FarmerRankingService:
         
         # Order metrics (last 90 days)
         cutoff_date = window_end - timedelta(days=90)
-        order_metrics = Order.objects.filter(
+        order_metrics = Order.alive.filter(
             farmer=farmer,
             created_at__date__gte=cutoff_date,
-            created_at__date__lte=window_end,
-            deleted_at__isnull=True
+            created_at__date__lte=window_end
         ).aggregate(
             total_orders=Count('id'),
             delivered_orders=Count('id', filter=Q(status='delivered')),
@@ -311,9 +303,8 @@ class FarmerRankingService:
             window_start = window_end - timedelta(days=self.config.evaluation_window_days)
         
         # Get farmers to evaluate
-        farmers_query = Farmer.objects.filter(
-            is_active=True,
-            deleted_at__isnull=True
+        farmers_query = Farmer.alive.filter(
+            is_active=True
         )
         
         if region:
@@ -333,14 +324,14 @@ class FarmerRankingService:
             score = self.compute_farmer_score(farmer, window_start, window_end)
             scores.append(score)
         
+        FarmerScore.rank_current_scores()
         return scores
     
     def get_farmer_rankings(self, region: Optional[Region] = None, limit: Optional[int] = None) -> models.QuerySet:
         """Get current farmer rankings."""
         
-        queryset = FarmerScore.objects.filter(
-            is_current=True,
-            deleted_at__isnull=True
+        queryset = FarmerScore.alive.filter(
+            is_current=True
         ).select_related('farmer', 'region').order_by('-total_score', 'farmer__id')
         
         if region:
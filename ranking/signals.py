@@ -0,0 +1,14 @@
+"""Signal handlers for the ranking app."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from farmers.models import Farmer
+
+from .models import FarmerScore
+
+
+@receiver([post_save, post_delete], sender=FarmerScore)
+def refresh_farmer_avg_score(sender, instance, **kwargs):
+    """Recompute the average score of the farmer a score belongs to."""
+    Farmer.refresh_avg_score([instance.farmer_id])
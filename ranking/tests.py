@@ -1,3 +1,82 @@
+import datetime
+from decimal import Decimal
+
 from django.test import TestCase
 
-# Create your tests here.
+from accounts.models import User
+from farmers.models import Farmer
+from regions.models import Region
+
+from .models import FarmerScore
+
+
+def make_farmer(username, region):
+    user = User.objects.create_user(username, f'{username}@example.com', 'pw', region=region)
+    return Farmer.objects.create(
+        user=user, region=region, contact_number='9000000000', address='Farm'
+    )
+
+
+def make_score(farmer, total_score, is_current=True, window_start=datetime.date(2026, 10, 1)):
+    return FarmerScore.objects.create(
+        farmer=farmer,
+        region=farmer.region,
+        window_start=window_start,
+        window_end=window_start + datetime.timedelta(days=14),
+        price_competitiveness=0,
+        consistency_score=0,
+        reliability_score=0,
+        fill_rate_score=0,
+        total_score=total_score,
+        is_current=is_current,
+    )
+
+
+class FarmerAverageScoreTests(TestCase):
+    """Farmer.avg_score follows the farmer's scores as they change."""
+
+    def setUp(self):
+        self.farmer = make_farmer('kavin', Region.objects.create(name='Erode', code='ERD'))
+
+    def avg_score(self):
+        self.farmer.refresh_from_db(fields=['avg_score'])
+        return self.farmer.avg_score
+
+    def test_average_tracks_created_updated_and_deleted_scores(self):
+        self.assertEqual(self.avg_score(), 0)
+
+        old = make_score(self.farmer, 60, is_current=False, window_start=datetime.date(2026, 9, 1))
+        current = make_score(self.farmer, 81)
+        self.assertEqual(self.avg_score(), Decimal('70.50'))
+
+        current.total_score = 90
+        current.save()
+        self.assertEqual(self.avg_score(), Decimal('75.00'))
+
+        old.delete()
+        self.assertEqual(self.avg_score(), Decimal('90.00'))
+
+        current.delete()
+        self.assertEqual(self.avg_score(), 0)
+
+    def test_other_farmers_are_untouched(self):
+        other = make_farmer('malar', self.farmer.region)
+        make_score(other, 50)
+        self.assertEqual(self.avg_score(), 0)
+
+
+class OverallRankTests(TestCase):
+    """rank_current_scores() stores competition ranks over current scores."""
+
+    def test_ties_share_a_rank_and_stale_scores_are_cleared(self):
+        region = Region.objects.create(name='Erode', code='ERD')
+        farmers = [make_farmer(f'farmer{i}', region) for i in range(4)]
+        stale = make_score(farmers[0], 99, is_current=False, window_start=datetime.date(2026, 9, 1))
+        FarmerScore.objects.filter(pk=stale.pk).update(overall_rank=1)
+        scores = [make_score(farmer, total) for farmer, total in zip(farmers, [80, 90, 80, 70])]
+
+        FarmerScore.rank_current_scores()
+
+        ranks = dict(FarmerScore.objects.values_list('id', 'overall_rank'))
+        self.assertEqual([ranks[score.pk] for score in scores], [2, 1, 2, 4])
+        self.assertIsNone(ranks[stale.pk])